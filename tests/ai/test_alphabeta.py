@@ -0,0 +1,51 @@
+from unittest import TestCase
+from tic_tac_toe.model import *
+from tic_tac_toe.ai import *
+
+class TestBoard(TestCase):
+    def setUp(self):
+        self.tictactoe = TicTacToe(size=(600, 600), dim=3, players=[Player(Symbol.CROSS), Player(Symbol.NOUGHT)])
+        self.tictactoe.place_mark(Mark(Cell(0, 0), Symbol.CROSS))
+        self.tictactoe.place_mark(Mark(Cell(1, 1), Symbol.NOUGHT))
+        self.board = Board.from_tic_tac_toe(self.tictactoe)
+
+    def test_from_tic_tac_toe(self):
+        self.assertEqual(7, len(self.board.moves()))
+        self.assertEqual(self.tictactoe.position_key, Board(self.board.rules, self.board.crosses, self.board.noughts).key)
+
+    def test_place_and_remove(self):
+        board = self.board.place(self.board.index(Cell(0, 1)))
+        self.tictactoe.place_mark(Mark(Cell(0, 1), Symbol.CROSS))
+        self.assertEqual(self.tictactoe.position_key, board.key)
+        self.assertEqual(self.board.key, board.remove(self.board.index(Cell(0, 1))).key)
+
+    def test_wins(self):
+        board = self.board.place(self.board.index(Cell(0, 1)))
+        self.assertFalse(board.wins(self.board.index(Cell(0, 1))))
+        board = board.place(self.board.index(Cell(0, 2)))
+        self.assertTrue(board.wins(self.board.index(Cell(0, 2))))
+
+    def test_removals(self):
+        board = self.board.place(self.board.index(Cell(2, 2))).place(self.board.index(Cell(2, 1)))
+        self.assertEqual([0, 7, 8], board.removals())
+        self.assertEqual([], board.pass_turn().removals())
+
+class TestAlphaBetaSearch(TestCase):
+    def setUp(self):
+        self.tictactoe = TicTacToe(size=(600, 600), dim=3, players=[Player(Symbol.CROSS), Player(Symbol.NOUGHT)])
+        self.search = AlphaBetaSearch(time_budget=0.2)
+
+    def test_takes_win(self):
+        self.tictactoe.marks = [Mark(Cell(0, 0), Symbol.CROSS), Mark(Cell(0, 1), Symbol.CROSS),
+                                Mark(Cell(1, 1), Symbol.NOUGHT), Mark(Cell(2, 2), Symbol.NOUGHT)]
+        self.assertEqual(Cell(0, 2), self.search.choose(self.tictactoe))
+
+    def test_blocks_loss(self):
+        self.tictactoe.marks = [Mark(Cell(0, 0), Symbol.CROSS), Mark(Cell(1, 2), Symbol.CROSS),
+                                Mark(Cell(1, 1), Symbol.NOUGHT), Mark(Cell(2, 1), Symbol.NOUGHT)]
+        self.assertEqual(Cell(0, 1), self.search.choose(self.tictactoe))
+
+    def test_large_board(self):
+        tictactoe = TicTacToe(size=(600, 600), dim=15, win_length=5)
+        tictactoe.marks = [Mark(Cell(7, 7 + i), Symbol.CROSS) for i in range(4)]
+        self.assertIn(self.search.choose(tictactoe), [Cell(7, 6), Cell(7, 11)])
@@ -0,0 +1,62 @@
+import time
+from unittest import TestCase, skipUnless
+from importlib.util import find_spec
+from tic_tac_toe.model import *
+from tic_tac_toe.simulation import play_games
+from tic_tac_toe.utils import Settings
+
+NUMPY = find_spec("numpy") is not None
+if NUMPY:
+    import numpy as np
+    from tic_tac_toe.ai.batch import *
+
+@skipUnless(NUMPY, "numpy is not installed")
+class TestBatchEngine(TestCase):
+    def assert_agrees(self, engine: 'BatchEngine'):
+        for board in range(engine.size):
+            winner = engine.to_tic_tac_toe(board).check_game_end()
+            self.assertEqual(SYMBOLS.get(int(engine.winner[board])), winner.symbol if winner else None)
+
+    def test_agrees_with_model(self):
+        for dim, win_length in [(3, None), (4, 3), (5, 4)]:
+            engine = BatchEngine(64, dim, win_length, seeds=range(64))
+            for _ in range(40):
+                engine.step(engine.random_moves())
+                self.assert_agrees(engine)
+
+    def test_rolling_removal(self):
+        engine = BatchEngine(256, seeds=range(256))
+        for _ in range(60):
+            engine.step(engine.random_moves())
+            live = ~engine.done
+            for symbol in (CROSS, NOUGHT):
+                self.assertTrue(((engine.cells[live] == symbol).sum(axis=1) <= 3).all())
+
+    def test_occupied_cell_passes_turn(self):
+        engine = BatchEngine(1)
+        engine.step(np.array([4]))
+        engine.step(np.array([4]))
+        self.assertEqual(CROSS, engine.turn[0])
+        self.assertEqual(1, np.count_nonzero(engine.cells[0]))
+
+    def test_seeded(self):
+        first, second = BatchEngine(32, seeds=range(32)), BatchEngine(32, seeds=range(32))
+        for _ in range(30):
+            first.step(first.random_moves())
+            second.step(second.random_moves())
+        self.assertTrue((first.cells == second.cells).all())
+        self.assertTrue((first.winner == second.winner).all())
+
+    def test_faster_than_the_simulator(self):
+        # random self-play, in games per second: the margin is far below the measured one (about 40x), to stay robust
+        start = time.perf_counter()
+        engine = BatchEngine(1000, seeds=range(1000))
+        for _ in range(200):
+            engine.step(engine.random_moves())
+            if engine.done.all():
+                break
+        batch = engine.size / (time.perf_counter() - start)
+        start = time.perf_counter()
+        report = play_games(Settings(debug=False), ('random', 'random'), list(range(50)))
+        simulated = report.games / (time.perf_counter() - start)
+        self.assertGreater(batch, 5 * simulated)
@@ -0,0 +1,67 @@
+import threading
+from unittest import TestCase
+from tic_tac_toe.model import *
+from tic_tac_toe.ai import Hint, HintService
+
+class TestHintService(TestCase):
+    def setUp(self):
+        self.tictactoe = TicTacToe(size=(600, 600), dim=3, players=[Player(Symbol.CROSS), Player(Symbol.NOUGHT)])
+        self.service = HintService(time_budget=0.5, cache_size=2)
+
+    def tearDown(self):
+        self.service.close()
+
+    def request(self, tic_tac_toe: TicTacToe) -> Hint:
+        done = threading.Event()
+        hints = []
+        self.service.request(tic_tac_toe, lambda hint: (hints.append(hint), done.set()))
+        self.assertTrue(done.wait(5))
+        return hints[0]
+
+    def test_winning_hint(self):
+        self.tictactoe.marks = [Mark(Cell(0, 0), Symbol.CROSS), Mark(Cell(0, 1), Symbol.CROSS),
+                                Mark(Cell(1, 1), Symbol.NOUGHT), Mark(Cell(2, 2), Symbol.NOUGHT)]
+        self.assertEqual(Hint(Cell(0, 2), 1.0, Symbol.CROSS), self.request(self.tictactoe))
+
+    def test_cached_by_symmetry(self):
+        self.tictactoe.marks = [Mark(Cell(0, 0), Symbol.CROSS), Mark(Cell(0, 1), Symbol.CROSS),
+                                Mark(Cell(1, 1), Symbol.NOUGHT), Mark(Cell(2, 2), Symbol.NOUGHT)]
+        self.request(self.tictactoe)
+        # the same position mirrored on the other diagonal
+        self.tictactoe.marks = [Mark(Cell(2, 2), Symbol.CROSS), Mark(Cell(1, 2), Symbol.CROSS),
+                                Mark(Cell(1, 1), Symbol.NOUGHT), Mark(Cell(0, 0), Symbol.NOUGHT)]
+        hints = []
+        self.assertTrue(self.service.request(self.tictactoe, hints.append))
+        self.assertEqual([Hint(Cell(0, 2), 1.0, Symbol.CROSS)], hints)
+        self.assertEqual(1, self.service.hits)
+
+    def test_bounded_cache(self):
+        for cell in [Cell(0, 0), Cell(0, 1), Cell(1, 1)]:
+            self.tictactoe.marks = [Mark(cell, Symbol.CROSS)]
+            self.tictactoe.turn = Symbol.NOUGHT
+            self.request(self.tictactoe)
+        self.assertEqual(2, len(self.service))
+
+    def test_no_hint_out_of_turn(self):
+        hints = []
+        self.assertTrue(self.service.request(self.tictactoe, hints.append, Symbol.NOUGHT))
+        self.assertEqual([Hint(None, 0.0, Symbol.NOUGHT)], hints)
+        self.assertEqual(0, self.service.misses)
+        self.assertEqual(Symbol.CROSS, self.request(self.tictactoe).symbol)
+
+    def test_does_not_block(self):
+        service = HintService(time_budget=0.3)
+        self.addCleanup(service.close)
+        done = threading.Event()
+        self.assertFalse(service.request(self.tictactoe, lambda hint: done.set()))
+        self.assertFalse(done.is_set())
+        self.assertTrue(done.wait(5))
+
+    def test_failing_callback_does_not_starve_the_others(self):
+        done = threading.Event()
+        def fail(hint: Hint):
+            raise ConnectionResetError("peer left")
+        self.service.request(self.tictactoe, fail)
+        self.service.request(self.tictactoe, lambda hint: done.set())
+        self.assertTrue(done.wait(5))
+        self.assertTrue(self.service.request(self.tictactoe, fail))
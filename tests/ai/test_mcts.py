@@ -0,0 +1,34 @@
+from unittest import TestCase
+from tic_tac_toe.model import *
+from tic_tac_toe.ai import *
+from tic_tac_toe.ai.mcts import _ChanceNode, _TerminalNode
+
+class TestMonteCarloTreeSearch(TestCase):
+    def setUp(self):
+        self.tictactoe = TicTacToe(size=(600, 600), dim=3, players=[Player(Symbol.CROSS), Player(Symbol.NOUGHT)])
+        self.search = MonteCarloTreeSearch(playouts=2000, time_budget=1, seed=42)
+
+    def test_takes_win(self):
+        self.tictactoe.marks = [Mark(Cell(0, 0), Symbol.CROSS), Mark(Cell(0, 1), Symbol.CROSS),
+                                Mark(Cell(1, 1), Symbol.NOUGHT), Mark(Cell(2, 2), Symbol.NOUGHT)]
+        self.assertEqual(Cell(0, 2), self.search.choose(self.tictactoe))
+
+    def test_models_rolling_removal(self):
+        self.tictactoe.marks = [Mark(Cell(0, 0), Symbol.CROSS), Mark(Cell(0, 1), Symbol.CROSS),
+                                Mark(Cell(2, 0), Symbol.CROSS), Mark(Cell(1, 1), Symbol.NOUGHT),
+                                Mark(Cell(2, 2), Symbol.NOUGHT)]
+        self.tictactoe.turn = Symbol.NOUGHT
+        cell = self.search.choose(self.tictactoe)
+        self.assertNotIn(cell, [Cell(0, 0), Cell(0, 1), Cell(2, 0), Cell(1, 1), Cell(2, 2)])
+        self.assertTrue(all(isinstance(child, (_ChanceNode, _TerminalNode)) for child in self.search._root.children.values()))
+
+    def test_reuses_tree(self):
+        cell = self.search.choose(self.tictactoe)
+        self.tictactoe.place_mark(Mark(cell, Symbol.CROSS))
+        self.tictactoe.change_turn()
+        self.tictactoe.place_mark(Mark(next(c for c in self.tictactoe.grid.cells if not self.tictactoe.has_mark(c)), Symbol.NOUGHT))
+        self.tictactoe.change_turn()
+        previous_root = self.search._root
+        self.search.choose(self.tictactoe)
+        self.assertIsNot(previous_root, self.search._root)
+        self.assertGreater(self.search._root.visits, self.search.playouts)
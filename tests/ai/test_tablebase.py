@@ -0,0 +1,65 @@
+import pathlib
+import tempfile
+from unittest import TestCase
+from tic_tac_toe.model import *
+import threading
+from tic_tac_toe.ai import AlphaBetaSearch, Hint, HintService, create_strategy
+from tic_tac_toe.ai.tablebase import Tablebase, TablebaseStrategy, generate
+
+class TestTablebase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = pathlib.Path(cls.directory.name) / "3x3.ttb"
+        generate(str(cls.path), dim=3)
+        cls.tablebase = Tablebase(str(cls.path))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tablebase.close()
+        cls.directory.cleanup()
+
+    def setUp(self):
+        self.tictactoe = TicTacToe(size=(600, 600), dim=3, players=[Player(Symbol.CROSS), Player(Symbol.NOUGHT)])
+
+    def test_all_positions_solved(self):
+        self.assertGreater(len(self.tablebase), 400)
+        cell, value = self.tablebase.probe(self.tictactoe)
+        self.assertIn(cell, self.tictactoe.grid.cells)
+        self.assertGreater(value, 0)
+
+    def test_winning_move(self):
+        self.tictactoe.marks = [Mark(Cell(0, 0), Symbol.CROSS), Mark(Cell(1, 0), Symbol.CROSS),
+                                Mark(Cell(1, 1), Symbol.NOUGHT), Mark(Cell(2, 2), Symbol.NOUGHT)]
+        self.assertEqual((Cell(2, 0), 1.0), self.tablebase.probe(self.tictactoe))
+
+    def test_symmetric_positions(self):
+        self.tictactoe.marks = [Mark(Cell(0, 0), Symbol.CROSS), Mark(Cell(0, 1), Symbol.CROSS),
+                                Mark(Cell(1, 1), Symbol.NOUGHT), Mark(Cell(2, 2), Symbol.NOUGHT)]
+        self.assertEqual((Cell(0, 2), 1.0), self.tablebase.probe(self.tictactoe))
+        self.assertEqual(Cell(0, 2), TablebaseStrategy(self.tablebase).choose(self.tictactoe))
+
+    def test_unsupported_grid(self):
+        self.assertIsNone(self.tablebase.probe(TicTacToe(size=(600, 600), dim=4)))
+
+    def test_registered_strategy(self):
+        strategy = create_strategy('tablebase', 0.05, tablebase=str(self.path))
+        self.assertIsInstance(strategy, TablebaseStrategy)
+        self.assertIsInstance(strategy.fallback, AlphaBetaSearch)
+        self.assertIs(strategy.tablebase, create_strategy('tablebase', 0.05, tablebase=str(self.path)).tablebase)
+        with self.assertRaises(ValueError):
+            create_strategy('tablebase', 0.05)
+
+    def test_fallback_on_other_grids(self):
+        strategy = create_strategy('tablebase', 0.05, tablebase=str(self.path))
+        self.assertIn(strategy.choose(TicTacToe(size=(600, 600), dim=4)), Grid(4).cells)
+
+    def test_hints_from_the_tablebase(self):
+        service = HintService(time_budget=0.01, tablebase=self.tablebase)
+        self.addCleanup(service.close)
+        self.tictactoe.marks = [Mark(Cell(0, 0), Symbol.CROSS), Mark(Cell(1, 1), Symbol.NOUGHT)]
+        done, hints = threading.Event(), []
+        service.request(self.tictactoe, lambda hint: (hints.append(hint), done.set()))
+        self.assertTrue(done.wait(5))
+        cell, value = self.tablebase.probe(self.tictactoe)
+        self.assertEqual(Hint(cell, value, Symbol.CROSS), hints[0])
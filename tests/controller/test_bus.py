@@ -0,0 +1,64 @@
+import threading
+import time
+from unittest import TestCase
+from tic_tac_toe.model import *
+from tic_tac_toe.controller import *
+
+class RecordingEventHandler(EventHandler):
+    def __init__(self, tic_tac_toe: TicTacToe, bus: EventBus):
+        super().__init__(tic_tac_toe)
+        self.bus = bus
+        self.placed = []
+
+    def on_mark_placed(self, tic_tac_toe: TicTacToe, cell: Cell, symbol: Symbol):
+        self.placed.append((cell, symbol))
+
+class TestEventBus(TestCase):
+    def setUp(self):
+        self.bus = EventBus()
+
+    def test_get_by_type(self):
+        self.bus.post(create_event(ControlEvent.CHANGE_TURN))
+        self.bus.post(create_event(LobbyEvent.JOIN_GAME, game_id=1))
+        self.bus.post(create_event(ControlEvent.GAME_START))
+        self.assertEqual([ControlEvent.GAME_START.value], [event.type for event in self.bus.get(ControlEvent.GAME_START.value)])
+        self.assertEqual([ControlEvent.CHANGE_TURN.value, LobbyEvent.JOIN_GAME.value], [event.type for event in self.bus.get()])
+        self.assertEqual(0, len(self.bus))
+
+    def test_non_events_are_dropped(self):
+        self.bus.post("[12:00] Player 'X': hello")
+        self.bus.post(create_event(LobbyEvent.JOIN_GAME, game_id=1))
+        self.assertEqual([LobbyEvent.JOIN_GAME.value], [event.type for event in self.bus.get(LobbyEvent.all_types())])
+        self.assertEqual(0, len(self.bus))
+        self.bus.post("hello")
+        self.assertEqual([], self.bus.get())
+        self.assertFalse(self.bus.wait(0.01))
+
+    def test_wait(self):
+        self.assertFalse(self.bus.wait(0.01))
+        threading.Timer(0.05, self.bus.post, [create_event(ControlEvent.GAME_START)]).start()
+        start = time.perf_counter()
+        self.assertTrue(self.bus.wait(5))
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertEqual(1, len(self.bus))
+
+    def test_wait_for_types(self):
+        self.bus.post(create_event(LobbyEvent.DELETE_GAME, game_id=1))
+        self.assertTrue(self.bus.wait(0.01))
+        start = time.perf_counter()
+        self.assertFalse(self.bus.wait(0.05, ControlEvent.all_types()))
+        self.assertGreaterEqual(time.perf_counter() - start, 0.04)
+        threading.Timer(0.02, self.bus.post, [create_event(ControlEvent.GAME_START)]).start()
+        self.assertTrue(self.bus.wait(5, ControlEvent.all_types()))
+
+    def test_handler_uses_bus(self):
+        handler = RecordingEventHandler(TicTacToe(size=(600, 600)), self.bus)
+        threads = [threading.Thread(target=handler.post_event, args=(ControlEvent.MARK_PLACED,),
+                                    kwargs=dict(cell=Cell(0, i), symbol=Symbol.CROSS)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        handler.handle_events()
+        self.assertEqual({(Cell(0, i), Symbol.CROSS) for i in range(3)}, set(handler.placed))
+        self.assertEqual(0, len(self.bus))
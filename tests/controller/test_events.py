@@ -0,0 +1,60 @@
+from unittest import TestCase
+import pygame
+from tic_tac_toe.model import *
+from tic_tac_toe.controller import *
+
+class RecordingEventHandler(EventHandler):
+    def __init__(self, tic_tac_toe: TicTacToe):
+        super().__init__(tic_tac_toe)
+        self.calls = []
+
+    def on_player_create_game(self):
+        self.calls.append(('create',))
+
+    def on_game_start(self, tic_tac_toe: TicTacToe):
+        self.calls.append(('start', tic_tac_toe))
+
+    def on_mark_placed(self, tic_tac_toe: TicTacToe, cell: Cell, symbol: Symbol):
+        self.calls.append(('mark', tic_tac_toe, cell, symbol))
+
+class TestEvents(TestCase):
+    def setUp(self):
+        self.tictactoe = TicTacToe(size=(600, 600))
+        self.handler = RecordingEventHandler(self.tictactoe)
+
+    def test_by_value(self):
+        for control_event in ControlEvent.all():
+            self.assertIs(control_event, ControlEvent.by_value(control_event.value))
+        for lobby_event in LobbyEvent.all():
+            self.assertIs(lobby_event, LobbyEvent.by_value(lobby_event.value))
+        self.assertRaises(KeyError, ControlEvent.by_value, -1)
+
+    def test_kind_of_event(self):
+        self.assertTrue(ControlEvent.is_control_event(create_event(ControlEvent.HINT)))
+        self.assertFalse(ControlEvent.is_control_event(create_event(LobbyEvent.JOIN_GAME)))
+        self.assertTrue(LobbyEvent.is_lobby_event(create_event(LobbyEvent.JOIN_GAME)))
+        self.assertFalse(LobbyEvent.is_lobby_event(pygame.event.Event(pygame.KEYDOWN)))
+
+    def test_every_event_has_a_handler(self):
+        self.assertEqual(ControlEvent.all(), {event for event, _ in EventHandler.HANDLERS.values()})
+        self.assertEqual(LobbyEvent.all(), {event for event, _ in LobbyEventHandler.HANDLERS.values()})
+
+    def test_dispatch(self):
+        self.handler.handle_event(create_event(ControlEvent.PLAYER_CREATE_GAME))
+        self.handler.handle_event(create_event(ControlEvent.GAME_START))
+        self.handler.handle_event(create_event(ControlEvent.MARK_PLACED, cell=Cell(1, 1), symbol=Symbol.CROSS))
+        self.handler.handle_event(pygame.event.Event(pygame.KEYDOWN))
+        self.assertEqual([('create',), ('start', self.tictactoe), ('mark', self.tictactoe, Cell(1, 1), Symbol.CROSS)],
+                         self.handler.calls)
+
+    def test_register_on_subclass(self):
+        class Handler(RecordingEventHandler):
+            def on_anything(self, tic_tac_toe: TicTacToe, **kwargs):
+                self.calls.append(('anything', kwargs))
+
+        Handler.register(ControlEvent.GAME_START, 'on_anything')
+        handler = Handler(self.tictactoe)
+        handler.handle_event(create_event(ControlEvent.GAME_START, reason='test'))
+        self.handler.handle_event(create_event(ControlEvent.GAME_START))
+        self.assertEqual([('anything', {'reason': 'test'})], handler.calls)
+        self.assertEqual([('start', self.tictactoe)], self.handler.calls)
@@ -24,3 +24,47 @@ class TestGrid(TestCase):
         cells: List[Cell] = list(Cell(i, j) for i in range(dim) for j in range(dim))
         self.assertEqual(dim, grid.dim)
         self.assertEqual(cells, grid.cells)
+
+    def test_grid_lines(self):
+        grid: Grid = Grid(3)
+        lines: Lines = grid.lines
+        self.assertIs(lines, Grid(3).lines)
+        self.assertEqual(8, len(lines))
+        self.assertIn((0, 4, 8), lines.cells)
+        self.assertIn((2, 4, 6), lines.cells)
+        self.assertEqual(4, len(lines.through[grid.index(Cell(1, 1))]))
+        self.assertEqual(0b100010001, lines.masks[lines.cells.index((0, 4, 8))])
+
+    def test_winning_lines(self):
+        lines: Lines = winning_lines(5, 3)
+        self.assertEqual(5 * 3 * 2 + 3 * 3 * 2, len(lines))
+        self.assertTrue(all(len(line) == 3 for line in lines.cells))
+
+    def test_cells_are_interned(self):
+        self.assertIs(Cell(1, 2), Cell(1, 2))
+        self.assertIs(Grid(3).cells[5], Grid(3).cells[5])
+        with self.assertRaises(AttributeError):
+            Cell(0, 0).x = 1
+
+    def test_interned_cells_keep_int_coordinates(self):
+        cell = Cell(1, 2)
+        self.assertIs(cell, Cell(1.0, 2))
+        self.assertIs(int, type(cell.x))
+        self.assertIs(int, type(Cell(7.0, 8.0).x))
+        with self.assertRaises(ValueError):
+            Cell(1.5, 2)
+
+    def test_cell_hash_is_precomputed(self):
+        cell = Cell(3, 4)
+        self.assertEqual(hash((3, 4)), hash(cell))
+        self.assertEqual(hash((3, 4)), cell._hash)
+        self.assertEqual("Cell(x=3, y=4)", repr(cell))
+        self.assertEqual({cell: 1}, {Cell(3.0, 4): 1})
+
+    def test_grid_win_length(self):
+        grid: Grid = Grid(15, 5)
+        self.assertEqual(5, grid.win_length)
+        self.assertEqual(Grid(15, 5), grid)
+        self.assertNotEqual(Grid(15), grid)
+        self.assertIn(Cell(14, 0), grid)
+        self.assertNotIn(Cell(15, 0), grid)
@@ -44,7 +44,7 @@ class TestTicTacToe(TestCase):
         self.assertEqual(self.tictactoe.players[1], self.tictactoe.get_turn_player())
 
     def test_initial_marks(self):
-        self.assertEqual(self.tictactoe.marks, list())
+        self.assertEqual(self.tictactoe.marks, tuple())
     
     def test_place_mark(self):
         cell = Cell(0, 0)
@@ -69,3 +69,128 @@ class TestTicTacToe(TestCase):
         self.tictactoe.marks = [Mark(Cell(0, 1), Symbol.CROSS), Mark(Cell(0, 0), Symbol.NOUGHT)]
         self.tictactoe.override(other)
         self.assertEqual(other, self.tictactoe)
+
+    def test_bitboards(self):
+        self.tictactoe.place_mark(Mark(Cell(0, 1), Symbol.CROSS))
+        self.tictactoe.place_mark(Mark(Cell(2, 2), Symbol.NOUGHT))
+        self.assertEqual(1 << 1, self.tictactoe.bitboard(Symbol.CROSS))
+        self.assertEqual(1 << 8, self.tictactoe.bitboard(Symbol.NOUGHT))
+        self.assertEqual(1, self.tictactoe.count_marks(Symbol.CROSS))
+        self.tictactoe.remove_mark(Cell(0, 1))
+        self.assertEqual(0, self.tictactoe.bitboard(Symbol.CROSS))
+        self.assertFalse(self.tictactoe.has_mark(Cell(0, 1)))
+
+    def test_remove_random_mark(self):
+        for cell in [Cell(0, 0), Cell(1, 1), Cell(2, 0)]:
+            self.tictactoe.place_mark(Mark(cell, Symbol.CROSS))
+        self.tictactoe.remove_random_mark()
+        self.assertEqual(2, self.tictactoe.count_marks(Symbol.CROSS))
+        self.assertEqual(2, len(self.tictactoe.get_crosses()))
+
+    def test_check_game_end(self):
+        self.tictactoe.players = [Player(Symbol.CROSS), Player(Symbol.NOUGHT)]
+        for cell in [Cell(0, 2), Cell(1, 1)]:
+            self.tictactoe.place_mark(Mark(cell, Symbol.NOUGHT))
+            self.assertIsNone(self.tictactoe.check_game_end(last_move=cell))
+        self.tictactoe.place_mark(Mark(Cell(2, 0), Symbol.NOUGHT))
+        self.assertEqual(Player(Symbol.NOUGHT), self.tictactoe.check_game_end(last_move=Cell(2, 0)))
+        self.assertEqual(Player(Symbol.NOUGHT), self.tictactoe.check_game_end())
+        self.tictactoe.remove_mark(Cell(1, 1))
+        self.assertIsNone(self.tictactoe.check_game_end())
+
+    def test_marks_view_is_cached(self):
+        self.tictactoe.place_mark(Mark(Cell(2, 0), Symbol.CROSS))
+        self.tictactoe.place_mark(Mark(Cell(0, 1), Symbol.NOUGHT))
+        marks = self.tictactoe.marks
+        self.assertEqual([Cell(0, 1), Cell(2, 0)], [mark.cell for mark in marks])
+        self.assertIs(marks, self.tictactoe.marks)
+        with self.assertRaises(AttributeError):
+            marks.append(Mark(Cell(1, 1), Symbol.CROSS))
+        self.tictactoe.remove_mark(Cell(0, 1))
+        self.assertEqual([Cell(2, 0)], [mark.cell for mark in self.tictactoe.marks])
+        self.assertEqual(2, len(marks))
+
+    def test_check_game_end_k_in_a_row(self):
+        tictactoe = TicTacToe(self.screen_size, dim=15, players=[Player(Symbol.CROSS)], win_length=5)
+        for i in range(4):
+            tictactoe.place_mark(Mark(Cell(3 + i, 10 - i), Symbol.CROSS))
+            self.assertIsNone(tictactoe.check_game_end(last_move=Cell(3 + i, 10 - i)))
+        tictactoe.place_mark(Mark(Cell(7, 6), Symbol.CROSS))
+        self.assertEqual(Player(Symbol.CROSS), tictactoe.check_game_end(last_move=Cell(7, 6)))
+        tictactoe.remove_mark(Cell(5, 8))
+        self.assertIsNone(tictactoe.check_game_end())
+        tictactoe.place_mark(Mark(Cell(5, 8), Symbol.CROSS))
+        self.assertEqual(Player(Symbol.CROSS), tictactoe.check_game_end())
+
+    def test_position_key(self):
+        initial_key = self.tictactoe.position_key
+        self.tictactoe.place_mark(Mark(Cell(1, 1), Symbol.CROSS))
+        self.tictactoe.change_turn()
+        key = self.tictactoe.position_key
+        self.assertNotEqual(initial_key, key)
+        other = TicTacToe(self.screen_size, dim=self.dim)
+        other.marks = [Mark(Cell(1, 1), Symbol.CROSS)]
+        other.turn = Symbol.NOUGHT
+        self.assertEqual(key, other.position_key)
+        self.tictactoe.remove_mark(Cell(1, 1))
+        self.tictactoe.change_turn()
+        self.assertEqual(initial_key, self.tictactoe.position_key)
+
+    def test_override_diff(self):
+        other = TicTacToe(self.screen_size, dim=self.dim, players=[Player(Symbol.CROSS)])
+        other.marks = [Mark(Cell(0, 2), Symbol.CROSS), Mark(Cell(1, 1), Symbol.CROSS)]
+        other.turn = Symbol.NOUGHT
+        self.tictactoe.marks = [Mark(Cell(0, 0), Symbol.NOUGHT), Mark(Cell(1, 1), Symbol.NOUGHT)]
+        diff = self.tictactoe.override(other)
+        self.assertEqual([Cell(0, 2)], [mark.cell for mark in diff.added])
+        self.assertEqual([Cell(0, 0)], [mark.cell for mark in diff.removed])
+        self.assertEqual([Cell(1, 1)], [mark.cell for mark in diff.changed])
+        self.assertTrue(diff.turn_changed)
+        self.assertEqual([Player(Symbol.CROSS)], diff.players_added)
+        self.assertEqual([Player(Symbol.NOUGHT)], diff.players_removed)
+        self.assertEqual(other, self.tictactoe)
+        self.assertFalse(self.tictactoe.override(other))
+
+    def test_undo_redo(self):
+        for cell in [Cell(0, 0), Cell(1, 1), Cell(2, 2)]:
+            self.tictactoe.place_mark(Mark(cell, Symbol.CROSS))
+        self.tictactoe.remove_random_mark()
+        self.tictactoe.change_turn()
+        key = self.tictactoe.position_key
+        self.assertEqual(5, len(self.tictactoe.history))
+        self.assertEqual(MoveKind.CHANGE_TURN, self.tictactoe.undo().kind)
+        self.assertEqual(MoveKind.REMOVE, self.tictactoe.undo().kind)
+        self.assertEqual(3, self.tictactoe.count_marks(Symbol.CROSS))
+        self.assertEqual(Symbol.CROSS, self.tictactoe.turn)
+        self.tictactoe.redo()
+        self.tictactoe.redo()
+        self.assertEqual(key, self.tictactoe.position_key)
+        self.assertFalse(self.tictactoe.can_redo)
+        while self.tictactoe.can_undo:
+            self.tictactoe.undo()
+        self.assertEqual((), self.tictactoe.marks)
+        self.tictactoe.place_mark(Mark(Cell(0, 1), Symbol.NOUGHT))
+        self.assertFalse(self.tictactoe.can_redo)
+        with self.assertRaises(ValueError):
+            self.tictactoe.redo()
+
+    def test_history_is_bounded(self):
+        for _ in range(HISTORY_LIMIT + 10):
+            self.tictactoe.change_turn()
+        self.assertEqual(HISTORY_LIMIT, len(self.tictactoe.history))
+        self.assertTrue(self.tictactoe.can_undo)
+        while self.tictactoe.can_undo:
+            self.tictactoe.undo()
+        self.assertEqual(Symbol.CROSS, self.tictactoe.turn)
+
+    def test_revision(self):
+        revision = self.tictactoe.revision
+        self.tictactoe.update(0.5)
+        self.assertEqual(revision, self.tictactoe.revision)
+        self.tictactoe.place_mark(Mark(Cell(0, 0), Symbol.CROSS))
+        self.assertGreater(self.tictactoe.revision, revision)
+        revision = self.tictactoe.revision
+        self.assertFalse(self.tictactoe.place_mark(Mark(Cell(0, 0), Symbol.NOUGHT)))
+        self.assertEqual(revision, self.tictactoe.revision)
+        self.tictactoe.change_turn()
+        self.assertGreater(self.tictactoe.revision, revision)
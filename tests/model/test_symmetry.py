@@ -0,0 +1,44 @@
+from unittest import TestCase
+from tic_tac_toe.model import *
+from tic_tac_toe.model.symmetry import TRANSFORMS
+
+class TestSymmetries(TestCase):
+    def setUp(self):
+        self.tictactoe = TicTacToe(size=(600, 600), dim=3, players=[Player(Symbol.CROSS), Player(Symbol.NOUGHT)])
+
+    def test_precomputed_per_dim(self):
+        self.assertIs(symmetries(3), symmetries(3))
+        self.assertIsNot(symmetries(3), symmetries(4))
+
+    def test_corners_are_equivalent(self):
+        keys = set()
+        for cell in [Cell(0, 0), Cell(0, 2), Cell(2, 0), Cell(2, 2)]:
+            self.tictactoe.marks = [Mark(cell, Symbol.CROSS)]
+            keys.add(self.tictactoe.canonical_position()[0])
+        self.assertEqual(1, len(keys))
+        self.tictactoe.marks = [Mark(Cell(0, 1), Symbol.CROSS)]
+        self.assertNotIn(self.tictactoe.canonical_position()[0], keys)
+
+    def test_turn_is_part_of_the_key(self):
+        key, _ = self.tictactoe.canonical_position()
+        self.tictactoe.turn = Symbol.NOUGHT
+        self.assertNotEqual(key, self.tictactoe.canonical_position()[0])
+
+    def test_transform_maps_moves_back(self):
+        self.tictactoe.marks = [Mark(Cell(2, 1), Symbol.CROSS), Mark(Cell(1, 1), Symbol.NOUGHT)]
+        key, transform = self.tictactoe.canonical_position()
+        symmetry = symmetries(3)
+        crosses, noughts, _ = symmetry.decode(key)
+        self.assertEqual(crosses, symmetry.transform(transform, self.tictactoe.bitboard(Symbol.CROSS)))
+        self.assertEqual(noughts, symmetry.transform(transform, self.tictactoe.bitboard(Symbol.NOUGHT)))
+        for cell in self.tictactoe.grid.cells:
+            self.assertEqual(cell, symmetry.restore_cell(transform, symmetry.transform_cell(transform, cell)))
+
+    def test_large_boards(self):
+        small, large = Symmetries(5), symmetries(9)
+        for symmetry in (small, large):
+            bitboard = sum(1 << i for i in range(0, symmetry.cells, 3))
+            for transform in range(TRANSFORMS):
+                image = symmetry.transform(transform, bitboard)
+                self.assertEqual(bitboard.bit_count(), image.bit_count())
+                self.assertEqual(bitboard, sum(1 << symmetry.restore_index(transform, i) for i in range(symmetry.cells) if image >> i & 1))
@@ -0,0 +1,50 @@
+import threading
+import time
+from unittest import TestCase
+from tic_tac_toe import TicTacToeGame
+from tic_tac_toe.controller import ControlEvent, EventBus, LobbyEvent
+from tic_tac_toe.model import *
+from tic_tac_toe.utils import Settings
+
+class TestIdleLoop(TestCase):
+    def setUp(self):
+        settings = Settings(gui=False, debug=False, seed=1, bot='cross', bot_strategy='random', idle=True, idle_timeout=10)
+        self.game = TicTacToeGame(settings, [Player(s) for s in Symbol.values()])
+        self.game.controller.bus = self.game.controller.bot.bus = EventBus()
+        self.passes = 0
+        simulate = self.game.simulate
+        def counted(dt: float):
+            self.passes += 1
+            simulate(dt)
+        self.game.simulate = counted
+        self.thread = threading.Thread(target=self.game.run, daemon=True)
+
+    def tearDown(self):
+        self.game.stop()
+        self.game.controller.bus.post(self.game.controller.create_event(ControlEvent.TIME_ELAPSED, dt=0))
+        self.thread.join(1)
+
+    def crosses(self) -> int:
+        return self.game.tic_tac_toe.count_marks(Symbol.CROSS)
+
+    def test_sleeps_until_an_event_arrives(self):
+        start = time.perf_counter()
+        self.thread.start()
+        time.sleep(0.3)
+        self.assertEqual(1, self.crosses())
+        passes = self.passes
+        self.assertLess(passes, 10)
+        free = next(cell for cell in self.game.tic_tac_toe.grid.cells if not self.game.tic_tac_toe.has_mark(cell))
+        woken = time.perf_counter()
+        self.game.controller.post_event(ControlEvent.MARK_PLACED, cell=free, symbol=Symbol.NOUGHT)
+        time.sleep(0.2)
+        self.assertEqual(2, self.crosses())
+        self.assertLess(self.passes - passes, 10)
+        # the time slept is simulated when the loop wakes up
+        self.assertAlmostEqual(woken - start, self.game.tic_tac_toe.time, delta=0.05)
+
+    def test_unconsumed_events_do_not_wake_it(self):
+        self.game.controller.bus.post(self.game.controller.create_event(LobbyEvent.DELETE_GAME, game_id=1))
+        self.thread.start()
+        time.sleep(0.3)
+        self.assertLess(self.passes, 10)
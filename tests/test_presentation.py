@@ -39,3 +39,31 @@ class TestPresentation(unittest.TestCase):
         actual = presentation.deserialize(self.serialized_event)
         expected = self.event
         self.assertEqual(actual, expected)
+
+    def test_deserialize_event_without_win_length(self):
+        # the shape sent before grids had a win length: a list of cells, and no dim in the config
+        actual = presentation.deserialize((DIR_CURRENT / "expected_v1.json").read_text())
+        self.assertEqual(actual, self.event)
+        self.assertEqual(3, actual.state.grid.win_length)
+        self.assertEqual(3, actual.state.config.dim)
+
+    def test_hint_event(self):
+        from tic_tac_toe.controller import ControlEvent
+        for cell in [Cell(1, 2), None]:
+            event = Event(ControlEvent.HINT.value, {"cell": cell, "value": 0.5, "symbol": Symbol.NOUGHT})
+            self.assertEqual(event, presentation.deserialize(presentation.serialize(event)))
+
+    def test_larger_grid_round_trip(self):
+        for dim, win_length in [(4, None), (5, None), (15, 5)]:
+            tic_tac_toe = TicTacToe(size=(600, 600), dim=dim, win_length=win_length)
+            tic_tac_toe.players = [Player(Symbol.CROSS), Player(Symbol.NOUGHT)]
+            tic_tac_toe.place_mark(Mark(
+                cell=Cell(dim - 1, dim - 2),
+                symbol=Symbol.CROSS,
+                size=(tic_tac_toe.size / tic_tac_toe.grid.dim),
+                position=tic_tac_toe.config.cell_symbol_position(dim - 1, dim - 2)
+            ))
+            actual = presentation.deserialize(presentation.serialize(tic_tac_toe))
+            self.assertEqual(tic_tac_toe, actual)
+            self.assertEqual(tic_tac_toe.grid, actual.grid)
+            self.assertEqual(tic_tac_toe.position_key, actual.position_key)
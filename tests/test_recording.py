@@ -0,0 +1,97 @@
+import pathlib
+import random
+import tempfile
+import threading
+from typing import Optional
+from unittest import TestCase
+from tic_tac_toe import TicTacToeGame
+from tic_tac_toe.controller import ControlEvent, EventBus
+from tic_tac_toe.model import *
+from tic_tac_toe.recording import EventReplayer, read_recording
+from tic_tac_toe.remote.centralised import TicTacToeTerminal
+from tic_tac_toe.remote.presentation import serialize, deserialize
+from tic_tac_toe.remote.tcp import Address, ServerEvent, TcpServer
+from tic_tac_toe.utils import Settings
+
+class TestRecording(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = str(pathlib.Path(self.directory.name) / "game.rec.gz")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def play(self, seed: Optional[int]) -> TicTacToeGame:
+        game = TicTacToeGame(Settings(gui=False, debug=False, seed=seed, record=self.path), [Player(s) for s in Symbol.values()])
+        game.controller.bus = EventBus()
+        moves = random.Random(seed)
+        for _ in range(60):
+            if not game.running:
+                break
+            free = [cell for cell in game.tic_tac_toe.grid.cells if not game.tic_tac_toe.has_mark(cell)]
+            game.controller.post_event(ControlEvent.MARK_PLACED, cell=moves.choice(free), symbol=game.tic_tac_toe.turn)
+            game.controller.time_elapsed(1 / 60)
+            game.controller.handle_events()
+        game.recorder.close()
+        return game
+
+    def test_seeded_games_are_repeatable(self):
+        first, second = self.play(3), self.play(3)
+        self.assertEqual(first.tic_tac_toe.marks, second.tic_tac_toe.marks)
+
+    def test_replay_reproduces_the_game(self):
+        game = self.play(11)
+        replayer = EventReplayer(self.path)
+        replayed = replayer.run()
+        self.assertEqual(game.recorder.events, replayer.events)
+        self.assertEqual(game.tic_tac_toe.position_key, replayed.position_key)
+        self.assertEqual(game.tic_tac_toe.marks, replayed.marks)
+        self.assertEqual(game.tic_tac_toe.time, replayed.time)
+        self.assertEqual(game.running, replayer.winner is None)
+
+    def test_unseeded_games_are_replayable(self):
+        for _ in range(10):
+            game = self.play(None)
+            header, _ = read_recording(self.path)
+            self.assertIsNotNone(header["seed"])
+            self.assertEqual(game.seed, header["seed"])
+            replayed = EventReplayer(self.path).run()
+            self.assertEqual(game.tic_tac_toe.marks, replayed.marks)
+
+    def test_recording_is_timestamped(self):
+        self.play(5)
+        header, events = read_recording(self.path)
+        self.assertEqual(5, header["seed"])
+        timestamps = [timestamp for timestamp, _ in events]
+        self.assertEqual(sorted(timestamps), timestamps)
+
+    def test_terminal_recording_replays_the_game(self):
+        listening = threading.Event()
+        server = TcpServer(Address.any_local_port().port, lambda event, *_: event is ServerEvent.LISTEN and listening.set())
+        self.addCleanup(server.close)
+        self.assertTrue(listening.wait(5))
+        settings = Settings(gui=False, debug=False, seed=9, record=self.path, port=server.address.port)
+        terminal = TicTacToeTerminal(Symbol.CROSS, settings=settings)
+        self.addCleanup(terminal.client.close)
+        terminal.controller.bus = EventBus()
+        # the coordinator's side of the game, sent to the terminal as states
+        coordinator = TicTacToe(size=settings.size, dim=settings.dim, players=[Player(s) for s in Symbol.values()])
+        for cell, symbol in [(Cell(0, 0), Symbol.CROSS), (Cell(1, 1), Symbol.NOUGHT), (Cell(2, 0), Symbol.CROSS)]:
+            terminal.controller.post_event(ControlEvent.MARK_PLACED, cell=cell, symbol=symbol)
+            coordinator.place_mark(Mark(cell, symbol))
+            coordinator.change_turn()
+            status = deserialize(serialize(coordinator))
+            terminal.controller.bus.post(terminal.controller.create_event(ControlEvent.TIME_ELAPSED, dt=0.5, status=status))
+            terminal.controller.time_elapsed(1 / 60)
+            terminal.controller.handle_events()
+        terminal.stop()
+        terminal.recorder.close()
+        header, _ = read_recording(self.path)
+        self.assertTrue(header["remote"])
+        replayer = EventReplayer(self.path)
+        replayed = replayer.run()
+        self.assertEqual(9, replayer.events)
+        self.assertEqual(3, len(replayed.marks))
+        self.assertEqual(terminal.tic_tac_toe.marks, replayed.marks)
+        self.assertEqual(terminal.tic_tac_toe.position_key, replayed.position_key)
+        self.assertEqual(terminal.tic_tac_toe.time, replayed.time)
@@ -0,0 +1,52 @@
+from unittest import TestCase
+from tic_tac_toe.scheduler import Scheduler
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class TestScheduler(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = Scheduler(self.clock)
+        self.ticks, self.broadcasts = [], []
+        self.scheduler.add("simulate", self.ticks.append, rate=60, fixed=True)
+        self.scheduler.add("broadcast", self.broadcasts.append, rate=10)
+
+    def advance(self, seconds: float, step: float=1 / 240):
+        end = self.clock.now + seconds
+        while self.clock.now < end - 1e-9:
+            self.clock.now = min(end, self.clock.now + step)
+            self.scheduler.run_pending()
+
+    def test_independent_rates(self):
+        self.advance(1)
+        self.assertEqual(60, len(self.ticks))
+        self.assertEqual(10, len(self.broadcasts))
+        self.assertAlmostEqual(1, sum(self.ticks))
+        self.assertAlmostEqual(1, sum(self.broadcasts), places=2)
+
+    def test_catches_up_on_fixed_steps(self):
+        self.advance(0.05, step=0.05)
+        self.assertEqual([1 / 60] * 3, self.ticks)
+
+    def test_drops_long_backlogs(self):
+        self.advance(10, step=10)
+        self.assertEqual(5, len(self.ticks))
+        self.advance(1 / 60, step=1 / 60)
+        self.assertEqual(6, len(self.ticks))
+
+    def test_idle_time(self):
+        self.assertAlmostEqual(1 / 60, self.scheduler.idle_time())
+        self.scheduler.add("every pass", lambda dt: None)
+        self.assertAlmostEqual(1 / 60, self.scheduler.idle_time())
+        self.clock.now = 1
+        self.assertEqual(0, self.scheduler.idle_time())
+
+    def test_idle_time_limit(self):
+        self.assertAlmostEqual(1 / 120, self.scheduler.idle_time(limit=1 / 120))
+        self.assertAlmostEqual(1 / 60, self.scheduler.idle_time(limit=1))
+        self.assertEqual(5, Scheduler(self.clock).idle_time(limit=5))
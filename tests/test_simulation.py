@@ -0,0 +1,28 @@
+from unittest import TestCase
+from tic_tac_toe.ai import Board, RandomStrategy
+from tic_tac_toe.model import Symbol, TicTacToe
+from tic_tac_toe.simulation import SimulatedGame, create_players, simulate
+from tic_tac_toe.utils import Settings
+
+class TestSimulation(TestCase):
+    def setUp(self):
+        self.settings = Settings(debug=False)
+
+    def test_simulated_game(self):
+        game = SimulatedGame(self.settings, {symbol: RandomStrategy(seed=1) for symbol in Symbol.values()})
+        winner = game.run()
+        self.assertIsNotNone(winner)
+        self.assertTrue(game.over)
+        self.assertEqual(winner, game.tic_tac_toe.check_game_end().symbol)
+
+    def test_simulate_is_reproducible(self):
+        report = simulate(self.settings, games=50, workers=1, seed=7)
+        self.assertEqual(50, report.games)
+        self.assertEqual(50, sum(report.outcomes.values()))
+        self.assertEqual(report.outcomes, simulate(self.settings, games=50, workers=2, seed=7).outcomes)
+
+    def test_players_have_independent_streams(self):
+        players = create_players(self.settings, ('random', 'random'), seed=3)
+        board = Board.from_tic_tac_toe(TicTacToe(size=(600, 600), dim=15))
+        moves = {symbol: [strategy.best_move(board) for _ in range(20)] for symbol, strategy in players.items()}
+        self.assertNotEqual(moves[Symbol.CROSS], moves[Symbol.NOUGHT])
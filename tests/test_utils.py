@@ -0,0 +1,62 @@
+from unittest import TestCase
+from tic_tac_toe.utils import Config, Viewport
+from tic_tac_toe.model import TicTacToe, Grid
+
+class TestConfig(TestCase):
+    def test_cell_at_matches_areas(self):
+        for width, height, dim in [(900, 600, 3), (1000, 700, 7), (640, 480, 100)]:
+            config = Config(width / dim, height / dim, dim)
+            for (i, j), ((left, right), (top, bottom)) in config.cells_area_matrix.items():
+                for x, y in [(left, top), (right - 1, bottom - 1)]:
+                    self.assertEqual((i, j), config.cell_at(x, y))
+
+    def test_cell_at_outside(self):
+        config = Config(100, 100, 3)
+        for x, y in [(-1, 0), (0, 300), (300, 0), (150, -0.5)]:
+            self.assertIsNone(config.cell_at(x, y))
+
+    def test_geometry_is_cached(self):
+        config = Config(100, 100, 3)
+        self.assertIs(config.cells_area_matrix, config.cells_area_matrix)
+        self.assertIs(config.cells_symbol_position, config.cells_symbol_position)
+
+    def test_geometry_is_invalidated(self):
+        config = Config(100, 100, 3)
+        matrix = config.cells_area_matrix
+        config.cell_width_size = 50
+        self.assertEqual(((50, 100), (0, 100)), config.cells_area_matrix[(1, 0)])
+        config.dim = 4
+        self.assertIsNot(matrix, config.cells_area_matrix)
+        self.assertEqual(16, len(config.cells_area_matrix))
+
+    def test_follows_the_grid(self):
+        tic_tac_toe = TicTacToe(size=(600, 600), dim=3)
+        tic_tac_toe.grid = Grid(6)
+        self.assertEqual(Config(100, 100, 6), tic_tac_toe.config)
+        self.assertEqual((5, 5), tic_tac_toe.config.cell_at(599, 599))
+
+class TestViewport(TestCase):
+    def test_identity(self):
+        viewport = Viewport(900, 600)
+        self.assertEqual((12.0, 34.0), viewport.to_world(12, 34))
+        self.assertEqual((0.0, 0.0, 900.0, 600.0), viewport.visible_area())
+
+    def test_zoom_keeps_the_point_under_the_cursor(self):
+        viewport = Viewport(900, 600)
+        world = viewport.to_world(300, 200)
+        viewport.zoom_at(4, 300, 200)
+        self.assertEqual(4, viewport.zoom)
+        for expected, actual in zip(world, viewport.to_world(300, 200)):
+            self.assertAlmostEqual(expected, actual)
+        for expected, actual in zip((300, 200), viewport.to_screen(*world)):
+            self.assertAlmostEqual(expected, actual)
+
+    def test_stays_within_the_world(self):
+        viewport = Viewport(900, 600)
+        viewport.scroll(100, 100)
+        self.assertEqual((0, 0), (viewport.x, viewport.y))
+        viewport.zoom_at(2, 0, 0)
+        viewport.scroll(-100, 10000)
+        self.assertEqual((0, 300), (viewport.x, viewport.y))
+        viewport.zoom_at(0.01, 450, 300)
+        self.assertEqual((1, 0, 0), (viewport.zoom, viewport.x, viewport.y))
@@ -0,0 +1,154 @@
+import os
+import random
+from unittest import TestCase
+import pygame
+from tic_tac_toe.model import *
+from tic_tac_toe.view import ScreenTicTacToeView, REPAINT_EVENTS
+from tic_tac_toe.controller.local import TicTacToeInputHandler
+
+class TestScreenTicTacToeView(TestCase):
+    def setUp(self):
+        self.tictactoe = TicTacToe(size=(600, 600), dim=8, players=[Player(Symbol.CROSS), Player(Symbol.NOUGHT)])
+        self.view = ScreenTicTacToeView(self.tictactoe, pygame.Surface((600, 600)))
+
+    def place(self, cell: Cell, symbol: Symbol):
+        self.tictactoe.place_mark(Mark(cell, symbol, size=self.tictactoe.size / self.tictactoe.grid.dim,
+                                       position=self.tictactoe.config.cell_symbol_position(cell.x, cell.y)))
+
+    def full_render(self) -> bytes:
+        screen = pygame.Surface((600, 600))
+        view = ScreenTicTacToeView(self.tictactoe, screen)
+        view.viewport = self.view.viewport
+        view.render()
+        return pygame.image.tobytes(screen, "RGB")
+
+    def test_first_frame_is_full(self):
+        self.view.render()
+        self.assertEqual([pygame.Rect(0, 0, 600, 600)], self.view.rects)
+
+    def test_static_frames_push_nothing(self):
+        self.view.render()
+        self.view.rects = []
+        self.view.render()
+        self.assertEqual([], self.view.rects)
+
+    def test_only_changed_cells_are_pushed(self):
+        self.view.render()
+        self.view.rects = []
+        self.place(Cell(2, 2), Symbol.CROSS)
+        self.view.render()
+        self.assertEqual(1, len(self.view.rects))
+        self.assertTrue(self.view.rects[0].contains(pygame.Rect(150, 150, 75, 75)))
+
+    def test_incremental_frames_match_a_full_repaint(self):
+        moves = random.Random(1)
+        self.view.render()
+        for _ in range(30):
+            cell = Cell(moves.randrange(8), moves.randrange(8))
+            if self.tictactoe.has_mark(cell):
+                self.tictactoe.remove_mark(cell)
+            else:
+                self.place(cell, moves.choice([Symbol.CROSS, Symbol.NOUGHT]))
+            self.view.render()
+        self.assertEqual(self.full_render(), pygame.image.tobytes(self.view._screen, "RGB"))
+
+    def test_render_cells_keeps_the_neighbouring_marks(self):
+        # cells small enough for the marks to spill over into their neighbours
+        self.tictactoe = TicTacToe(size=(600, 600), dim=100, players=[Player(Symbol.CROSS), Player(Symbol.NOUGHT)])
+        self.view = ScreenTicTacToeView(self.tictactoe, pygame.Surface((600, 600)))
+        for x in range(1, 4):
+            for y in range(1, 4):
+                self.place(Cell(x, y), Symbol.CROSS if (x + y) % 2 else Symbol.NOUGHT)
+        self.view.render()
+        centre = Cell(2, 2)
+        for change in (lambda: self.tictactoe.remove_mark(centre), lambda: self.place(centre, Symbol.CROSS)):
+            change()
+            self.view._dirty.clear()
+            self.view.rects = []
+            self.view.render_cells({centre})
+            expected = self.view._mark_rect(centre).union(self.view._cell_rect(centre))
+            self.assertEqual([expected], self.view.rects)
+            self.assertEqual(self.full_render(), pygame.image.tobytes(self.view._screen, "RGB"))
+
+    def test_new_grid_repaints_everything(self):
+        self.view.render()
+        self.view.rects = []
+        self.tictactoe.grid = Grid(4)
+        self.view.render()
+        self.assertEqual([pygame.Rect(0, 0, 600, 600)], self.view.rects)
+
+    def test_sprites_are_cached(self):
+        self.place(Cell(0, 0), Symbol.CROSS)
+        self.view.render()
+        sprite = self.view._sprites[Symbol.CROSS]
+        self.place(Cell(1, 1), Symbol.CROSS)
+        self.view.render()
+        self.assertIs(sprite, self.view._sprites[Symbol.CROSS])
+        self.assertNotIn(Symbol.NOUGHT, self.view._sprites)
+
+    def test_sprites_follow_the_cell_size(self):
+        self.place(Cell(0, 0), Symbol.NOUGHT)
+        self.view.render()
+        sprite = self.view._sprites[Symbol.NOUGHT]
+        self.tictactoe.config.cell_width_size = self.tictactoe.config.cell_height_size = 50
+        self.view.render()
+        self.assertIsNot(sprite, self.view._sprites[Symbol.NOUGHT])
+        self.assertLess(self.view._sprites[Symbol.NOUGHT].get_width(), sprite.get_width())
+
+    def test_scrolling_keeps_the_sprites(self):
+        self.place(Cell(2, 2), Symbol.CROSS)
+        self.view.viewport.zoom_at(2, 0, 0)
+        self.view.render()
+        sprite = self.view._sprites[Symbol.CROSS]
+        self.view.rects = []
+        self.view.viewport.scroll(100, 100)
+        self.view.render()
+        self.assertEqual([pygame.Rect(0, 0, 600, 600)], self.view.rects)
+        self.assertIs(sprite, self.view._sprites[Symbol.CROSS])
+        self.assertEqual(self.full_render(), pygame.image.tobytes(self.view._screen, "RGB"))
+
+    def test_draw_functions_are_cached(self):
+        self.assertIs(self.view.draw_line, self.view.draw_line)
+
+    def test_zoomed_frames_match_a_full_repaint(self):
+        self.view.viewport.zoom_at(3, 200, 400)
+        moves = random.Random(2)
+        self.view.render()
+        for _ in range(30):
+            self.place(Cell(moves.randrange(8), moves.randrange(8)), moves.choice([Symbol.CROSS, Symbol.NOUGHT]))
+            self.view.render()
+        self.assertEqual(self.full_render(), pygame.image.tobytes(self.view._screen, "RGB"))
+
+    def test_only_visible_marks_are_drawn(self):
+        for x in range(8):
+            for y in range(8):
+                self.place(Cell(x, y), Symbol.CROSS)
+        self.view.viewport.zoom_at(4, 0, 0)
+        self.view.render()
+        columns, rows = self.view._visible_cells()
+        self.assertEqual((range(0, 3), range(0, 3)), (columns, rows))
+        self.assertEqual(9, len(self.view._visible_marks()))
+
+    def test_clicks_go_through_the_viewport(self):
+        handler = TicTacToeInputHandler(self.tictactoe, self.view.viewport)
+        self.assertEqual(Cell(1, 1), handler._to_cell(pygame.Vector2(100, 100)))
+        self.view.viewport.zoom_at(2, 0, 0)
+        self.view.viewport.scroll(600, 0)
+        self.assertEqual(Cell(4, 0), handler._to_cell(pygame.Vector2(100, 100)))
+
+class TestWindowEvents(TestCase):
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        self.addCleanup(pygame.display.quit)
+        self.view = ScreenTicTacToeView(TicTacToe(size=(600, 600), dim=3))
+
+    def test_uncovered_window_is_repainted(self):
+        self.view.render()
+        self.view.rects = []
+        self.view.render()
+        self.assertEqual([], self.view.rects)
+        pygame.event.post(pygame.event.Event(pygame.WINDOWEXPOSED))
+        self.view.render()
+        self.assertEqual([pygame.Rect(0, 0, 600, 600)], self.view.rects)
+        self.assertEqual([], pygame.event.get(REPAINT_EVENTS))
@@ -1,27 +1,40 @@
 import pygame
+import random
 from .model import *
 from .log import logger, logging
 from .utils import Settings
 from .view import ShowNothingTicTacToeView
 from .controller.mark_utils import *
+from .scheduler import Scheduler
 from typing import List
 
 class TicTacToeGame:
+    # set by games that mirror the state of another process, rather than computing it from their own events
+    remote = False
+
     def __init__(self, settings: Settings=None, players: List[Player]=[]):
         self.settings = settings or Settings()
         self.logger = logger("TicTacToeGame")
+        # a recorded game needs a concrete seed, or its random removals could not be replayed
+        self.seed = self.settings.seed
+        if self.seed is None and self.settings.record is not None:
+            self.seed = random.randrange(2**32)
         self.tic_tac_toe = TicTacToe(
             size=self.settings.size,
             dim=self.settings.dim,
-            players=players
+            players=players,
+            win_length=self.settings.win_length,
+            seed=self.seed
         )
         self.dt = None
         self._turn: Player = None
         self.mark_utils = MarkUtils()
         self.view = self.create_view() if self.settings.gui else ShowNothingTicTacToeView(self.tic_tac_toe)
-        self.clock = pygame.time.Clock()
+        self.scheduler: Scheduler = None
         self.running = True
+        self.recorder = self.create_recorder()
         self.controller = self.create_controller()
+        self.controller.recorder = self.recorder
         if self.settings.debug:
             self.logger.setLevel(logging.INFO)
 
@@ -39,7 +52,17 @@ class TicTacToeGame:
 
         class Controller(TicTacToeLocalController):
             def __init__(self):
-                super().__init__(game.tic_tac_toe)
+                super().__init__(game.tic_tac_toe, game.view.viewport)
+                self.bot = game.create_bot()
+
+            def mouse_clicked(this):
+                if this.bot is None or not this.bot.in_turn:
+                    super().mouse_clicked()
+
+            def handle_inputs(this, dt: float=None, symbol: Symbol=None):
+                if this.bot is not None:
+                    this.bot.handle_inputs(dt)
+                super().handle_inputs(dt, symbol)
 
             def on_player_join(this, tic_tac_toe: TicTacToe, symbol: Symbol, **kwargs):
                 super().on_player_join(tic_tac_toe, symbol, **kwargs)
@@ -56,33 +79,93 @@ class TicTacToeGame:
 
         return Controller()
 
+    def create_bot(self):
+        if self.settings.bot is None:
+            return None
+        from .ai import BotInputHandler, create_strategy
+        strategy = create_strategy(self.settings.bot_strategy, self.settings.bot_time_budget, self.seed, self.settings.tablebase)
+        return BotInputHandler(self.tic_tac_toe, Symbol[self.settings.bot.upper()], strategy)
+
+    def create_recorder(self):
+        if self.settings.record is None:
+            return None
+        from .recording import EventRecorder
+        return EventRecorder(self.settings.record, self.tic_tac_toe, self.seed, self.remote)
+
     def create_view(self):
         from .view import ScreenTicTacToeView
         return ScreenTicTacToeView(self.tic_tac_toe)
 
     def before_run(self):
         pygame.init()
+        if self.settings.idle and self.controller.bus is None:
+            # events nobody consumes would stay queued, and wake the idle loop over and over
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed([*self.controller.INPUT_EVENTS, *self.controller.GAME_EVENTS, *self.view.EVENTS])
 
     def after_run(self):
+        if self.recorder is not None:
+            self.recorder.close()
         pygame.quit()
 
     def at_each_run(self):
         if self.settings.gui:
-            pygame.display.flip()
+            self.view.present()
+
+    @property
+    def render_rate(self) -> int:
+        return self.settings.fps
+
+    def create_scheduler(self) -> Scheduler:
+        scheduler = Scheduler()
+        if self.settings.idle:
+            # both run on every wake: the time slept is simulated as a single step, and views only draw what changed
+            scheduler.add("simulate", self.simulate)
+            scheduler.add("render", self.render)
+        else:
+            scheduler.add("simulate", self.simulate, self.settings.tick_rate or self.settings.fps, fixed=True)
+            scheduler.add("render", self.render, self.render_rate)
+        return scheduler
+
+    def simulate(self, dt: float):
+        if self.running:
+            self.dt = dt
+            self.controller.handle_inputs(dt)
+            self.controller.handle_events()
+
+    def render(self, dt: float):
+        self.view.render()
+        self.at_each_run()
 
     def run(self):
         try:
             self.dt = 0
             self.before_run()
+            self.scheduler = self.create_scheduler()
             while self.running:
-                self.controller.handle_inputs(self.dt)
-                self.controller.handle_events()
-                self.view.render()
-                self.at_each_run()
-                self.dt = self.clock.tick(self.settings.fps) / 1000
+                revision = self.tic_tac_toe.revision
+                self.scheduler.run_pending()
+                if not self.settings.idle:
+                    self.scheduler.sleep()
+                elif self.tic_tac_toe.revision == revision:
+                    # a pass that changed something may have enabled another (e.g. a bot in turn), so only an idle one blocks
+                    self.wait_for_events(self.scheduler.idle_time(limit=self.settings.idle_timeout))
         finally:
             self.after_run()
 
+    def wait_for_events(self, timeout: float) -> bool:
+        if self.controller.bus is not None:
+            return self.controller.bus.wait(timeout, self.controller.GAME_EVENTS)
+        if timeout <= 0:
+            return False
+        # pygame.event.wait takes the event off the queue, so it is queued again, ahead of anything that came with it
+        event = pygame.event.wait(max(1, round(timeout * 1000)))
+        if event.type == pygame.NOEVENT:
+            return False
+        for queued in [event, *pygame.event.get()]:
+            pygame.event.post(queued)
+        return True
+
     def stop(self):
         self.running = False
 
@@ -9,8 +9,8 @@ def arg_parser() -> ArgumentParser:
     ap = ArgumentParser()
     ap.prog = "python -m " + tic_tac_toe.__name__
     mode = ap.add_argument_group("mode")
-    mode.add_argument("--mode", '-m', choices=['local', 'centralised'],
-                      help="Run the game in local or centralised mode")
+    mode.add_argument("--mode", '-m', choices=['local', 'centralised', 'simulate', 'replay'],
+                      help="Run the game in local or centralised mode, simulate headless games between bots or replay a recording")
     mode.add_argument("--role", '-r', required=False, choices=['coordinator', 'terminal'],
                       help="Run the game with a central coordinator, in either coordinator or terminal role")
     networking = ap.add_argument_group("networking")
@@ -21,10 +21,39 @@ def arg_parser() -> ArgumentParser:
     game.add_argument("--join-game", '-j', help="Join an existing game by its ID", type=int, dest="game_id", default=None)
     game.add_argument("--symbol", '-s', choices=[symbol.name.lower() for symbol in Symbol.values()],
                       help="Symbol to play with", default=Symbol.CROSS, dest="symbol")
+    game.add_argument("--bot", '-b', choices=[symbol.name.lower() for symbol in Symbol.values()],
+                      help="Let the computer play with the given symbol (local mode only)", default=None)
+    game.add_argument("--bot-strategy", choices=['random', 'alphabeta', 'mcts', 'tablebase'], default=Settings.bot_strategy,
+                      help="Search algorithm used by the computer", dest="bot_strategy")
+    game.add_argument("--bot-time", help="Thinking time of the computer per move, in seconds", type=float,
+                      default=Settings.bot_time_budget, dest="bot_time_budget")
+    game.add_argument("--tablebase", help="Tablebase (see python -m tic_tac_toe.ai.generate_tablebase) for the 'tablebase' strategy and for hints",
+                      type=str, default=None)
     game.add_argument("--debug", '-d', help="Enable debug mode", action="store_true", default=False)
     game.add_argument("--size", '-S', help="Size of the game window", type=int, nargs=2, default=[900, 600])
     game.add_argument("--fps", '-f', help="Frames per second", type=int, default=60)
+    game.add_argument("--tick-rate", help="Simulation ticks per second (defaults to the frames per second)", type=int,
+                      default=None, dest="tick_rate")
+    game.add_argument("--broadcast-rate", help="State broadcasts per second of a coordinator (0: on every change)", type=int,
+                      default=Settings.broadcast_rate, dest="broadcast_rate")
+    game.add_argument("--dim", help="Number of cells per side of the grid", type=int, default=Settings.dim)
+    game.add_argument("--win-length", '-k', help="Marks in a row needed to win (defaults to the grid dimension)",
+                      type=int, default=None, dest="win_length")
     game.add_argument("--no-gui", help="Disable GUI", action="store_true", default=False)
+    game.add_argument("--idle", help="Sleep until an input or event arrives instead of looping at a fixed rate",
+                      action="store_true", default=False)
+    game.add_argument("--record", help="Record the events of the game to this file", type=str, default=None)
+    replay = ap.add_argument_group("replay")
+    replay.add_argument("--replay", help="Recording to replay", type=str, default=None)
+    replay.add_argument("--real-time", help="Replay at the recorded pace instead of as fast as possible",
+                        action="store_true", default=False, dest="real_time")
+    simulation = ap.add_argument_group("simulation")
+    simulation.add_argument("--games", '-n', help="Number of games to simulate", type=int, default=1000)
+    simulation.add_argument("--workers", '-w', help="Number of worker processes (defaults to the CPU count)", type=int, default=None)
+    simulation.add_argument("--players", '-P', choices=['random', 'alphabeta', 'mcts', 'tablebase'], nargs=2, default=['random', 'random'],
+                            help="Strategies of the cross and nought players", metavar=("CROSS", "NOUGHT"))
+    simulation.add_argument("--max-moves", help="Stop a simulated game after this many moves", type=int, default=200, dest="max_moves")
+    simulation.add_argument("--seed", help="Seed of the game, or of the first simulated game", type=int, default=None)
     return ap
 
 def args_to_settings(args: Any) -> Settings:
@@ -32,7 +61,18 @@ def args_to_settings(args: Any) -> Settings:
     settings.host = args.host
     settings.port = args.port
     settings.fps = args.fps
+    settings.tick_rate = args.tick_rate
+    settings.broadcast_rate = args.broadcast_rate or None
     settings.gui = not args.no_gui
+    settings.dim = args.dim
+    settings.win_length = args.win_length
+    settings.bot = args.bot
+    settings.bot_strategy = args.bot_strategy
+    settings.bot_time_budget = args.bot_time_budget
+    settings.tablebase = args.tablebase
+    settings.seed = args.seed
+    settings.record = args.record
+    settings.idle = args.idle
     return settings
 
 
@@ -43,6 +83,21 @@ settings = args_to_settings(args)
 if args.mode == 'local':
     tic_tac_toe.main(settings)
     exit(0)
+if args.mode == 'simulate':
+    from tic_tac_toe.simulation import main_simulation
+    main_simulation(
+        games=args.games,
+        strategies=tuple(args.players),
+        workers=args.workers,
+        max_moves=args.max_moves,
+        seed=args.seed or 0,
+        settings=settings
+    )
+    exit(0)
+if args.mode == 'replay':
+    from tic_tac_toe.recording import main_replay
+    main_replay(args.replay, args.real_time, settings)
+    exit(0)
 if args.mode == 'centralised':
     from tic_tac_toe.remote.centralised import main_lobby, main_terminal
     if args.role == 'coordinator':
@@ -0,0 +1,22 @@
+from .board import Board, Rules, rules, bits
+from .strategy import Strategy, RandomStrategy
+from .alphabeta import AlphaBetaSearch
+from .mcts import MonteCarloTreeSearch
+from .player import BotInputHandler
+from .tablebase import Tablebase, TablebaseStrategy, open_tablebase
+from .hints import Hint, HintService
+from typing import Optional
+
+STRATEGIES = {
+    'random': lambda time_budget, seed, tablebase: RandomStrategy(seed),
+    'alphabeta': lambda time_budget, seed, tablebase: AlphaBetaSearch(time_budget=time_budget),
+    'mcts': lambda time_budget, seed, tablebase: MonteCarloTreeSearch(time_budget=time_budget, seed=seed),
+    # solved positions come from the tablebase, the others (e.g. of other grids) from alpha-beta
+    'tablebase': lambda time_budget, seed, tablebase: TablebaseStrategy(open_tablebase(tablebase),
+                                                                        AlphaBetaSearch(time_budget=time_budget)),
+}
+
+def create_strategy(name: str, time_budget: float, seed: int=None, tablebase: Optional[str]=None) -> Strategy:
+    if name == 'tablebase' and tablebase is None:
+        raise ValueError("The 'tablebase' strategy needs the path of a tablebase")
+    return STRATEGIES[name](time_budget, seed, tablebase)
@@ -0,0 +1,127 @@
+import time
+from typing import List, Optional, Tuple
+from ..model.symmetry import IDENTITY
+from .board import Board
+from .strategy import Strategy
+
+WIN = 1_000_000
+INFINITY = float('inf')
+EXACT, LOWER, UPPER = 0, 1, 2
+LINE_WEIGHTS = (0, 1, 10, 100, 1_000, 10_000)
+# spreads canonical keys, whose low bits are just the crosses, over the table
+SLOT_MULTIPLIER = 0x9E3779B97F4A7C15
+
+class _Timeout(Exception):
+    pass
+
+class AlphaBetaSearch(Strategy):
+    def __init__(self, time_budget: float=0.05, max_depth: int=32, table_size: int=1 << 16, symmetric: bool=True):
+        super().__init__()
+        assert table_size & (table_size - 1) == 0, f"Transposition table size must be a power of 2: {table_size}"
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self._table: List[Optional[Tuple]] = [None] * table_size
+        self._table_mask = table_size - 1
+        # share table entries between rotated and reflected positions (only affordable on small boards)
+        self.symmetric = symmetric
+        self._deadline = 0.0
+        self.nodes = 0
+        # value of the last searched position, from the point of view of the player in turn
+        self.value = 0.0
+
+    def best_move(self, board: Board) -> int:
+        self._deadline = time.perf_counter() + self.time_budget
+        self.nodes = 0
+        moves = board.moves()
+        best, value, depth = moves[0], 0, 0
+        for depth in range(1, self.max_depth + 1):
+            try:
+                value, best = self._root(board, depth, best)
+            except _Timeout:
+                depth -= 1
+                break
+            if abs(value) >= WIN:
+                break
+        self.logger.debug(f"Best move {board.cell(best)} (value: {value}, depth: {depth}, nodes: {self.nodes})")
+        self.value = value
+        return best
+
+    def evaluate(self, board: Board) -> float:
+        masks = board.rules.masks
+        if masks is None:
+            return 0
+        mine, theirs = board.mine, board.theirs
+        weights = LINE_WEIGHTS
+        score = 0
+        for mask in masks:
+            my_marks, their_marks = mine & mask, theirs & mask
+            if my_marks and not their_marks:
+                score += weights[min(my_marks.bit_count(), len(weights) - 1)]
+            elif their_marks and not my_marks:
+                score -= weights[min(their_marks.bit_count(), len(weights) - 1)]
+        return score
+
+    def _root(self, board: Board, depth: int, first: int) -> Tuple[float, int]:
+        moves = board.moves()
+        moves.remove(first)
+        moves.insert(0, first)
+        alpha, best = -INFINITY, first
+        for move in moves:
+            value = self._move_value(board, move, depth, alpha, INFINITY)
+            if value > alpha:
+                alpha, best = value, move
+        return alpha, best
+
+    def _move_value(self, board: Board, move: int, depth: int, alpha: float, beta: float) -> float:
+        child = board.place(move)
+        if child.wins(move):
+            return WIN + depth
+        return -self._chance(child.pass_turn(), depth - 1, -beta, -alpha)
+
+    def _chance(self, board: Board, depth: int, alpha: float, beta: float) -> float:
+        removals = board.removals()
+        if not removals:
+            return self._negamax(board, depth, alpha, beta)
+        # the rolling rule removes one of the marks uniformly at random: take the expected value
+        return sum(self._negamax(board.remove(index), depth, -INFINITY, INFINITY) for index in removals) / len(removals)
+
+    def _negamax(self, board: Board, depth: int, alpha: float, beta: float) -> float:
+        self.nodes += 1
+        if self.nodes & 0xff == 0 and time.perf_counter() > self._deadline:
+            raise _Timeout()
+        symmetric = self.symmetric and board.rules.masks is not None
+        key, transform = board.canonical() if symmetric else (board.key, IDENTITY)
+        slot = (key * SLOT_MULTIPLIER >> 16 if symmetric else key) & self._table_mask
+        entry = self._table[slot]
+        best_move = None
+        if entry is not None and entry[0] == key:
+            best_move = board.rules.symmetries.restore_index(transform, entry[4]) if entry[4] is not None else None
+            if entry[1] >= depth:
+                flag, value = entry[2], entry[3]
+                if flag == EXACT:
+                    return value
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                elif flag == UPPER:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+        if depth <= 0:
+            return self.evaluate(board)
+        moves = board.moves()
+        if not moves:
+            return 0
+        if best_move is not None and best_move in moves:
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+        original_alpha, best_value = alpha, -INFINITY
+        for move in moves:
+            value = self._move_value(board, move, depth, alpha, beta)
+            if value > best_value:
+                best_value, best_move = value, move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+        flag = UPPER if best_value <= original_alpha else LOWER if best_value >= beta else EXACT
+        self._table[slot] = (key, depth, flag, best_value, board.rules.symmetries.transform_index(transform, best_move))
+        return best_value
@@ -0,0 +1,85 @@
+import numpy as np
+from typing import Iterable
+from ..model import TicTacToe, Player, Mark, Symbol, winning_lines
+
+EMPTY, CROSS, NOUGHT = 0, 1, 2
+SYMBOLS = {CROSS: Symbol.CROSS, NOUGHT: Symbol.NOUGHT}
+NO_WINNER = 0
+
+def _splitmix64(state: np.ndarray) -> np.ndarray:
+    state += np.uint64(0x9E3779B97F4A7C15)
+    z = state.copy()
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+def _nth_true(mask: np.ndarray, n: np.ndarray) -> np.ndarray:
+    return np.argmax(mask.cumsum(axis=1) > n[:, None], axis=1)
+
+class BatchEngine:
+    def __init__(self, size: int, dim: int=3, win_length: int=None, seeds: Iterable[int]=None):
+        self.size = size
+        self.dim = dim
+        self.win_length = win_length or dim
+        lines = winning_lines(dim, self.win_length)
+        self.lines = np.zeros((len(lines), dim * dim), dtype=np.int16)
+        for line, indexes in enumerate(lines.cells):
+            self.lines[line, list(indexes)] = 1
+        self.cells = np.zeros((size, dim * dim), dtype=np.int8)
+        self.turn = np.full(size, CROSS, dtype=np.int8)
+        self.winner = np.full(size, NO_WINNER, dtype=np.int8)
+        seeds = np.arange(size) if seeds is None else np.fromiter(seeds, dtype=np.uint64, count=size)
+        self._rng = seeds.astype(np.uint64)
+
+    @property
+    def done(self) -> np.ndarray:
+        return self.winner != NO_WINNER
+
+    def legal_moves(self) -> np.ndarray:
+        return (self.cells == EMPTY) & ~self.done[:, None]
+
+    def random_moves(self) -> np.ndarray:
+        legal = self.legal_moves()
+        counts = legal.sum(axis=1)
+        choice = _splitmix64(self._rng) % np.maximum(counts, 1).astype(np.uint64)
+        return _nth_true(legal, choice.astype(np.int64))
+
+    def wins(self, symbol: int) -> np.ndarray:
+        counts = (self.cells == symbol).astype(np.int16) @ self.lines.T
+        return (counts == self.win_length).any(axis=1)
+
+    def step(self, moves: np.ndarray) -> np.ndarray:
+        # mirrors TicTacToeEventHandler: place the mark, then either end the game or change turn and apply the rolling rule
+        active = ~self.done
+        rows = np.nonzero(active)[0]
+        moves = np.asarray(moves)[rows]
+        free = self.cells[rows, moves] == EMPTY
+        self.cells[rows[free], moves[free]] = self.turn[rows[free]]
+        won = np.zeros(self.size, dtype=bool)
+        for symbol in (CROSS, NOUGHT):
+            movers = active & (self.turn == symbol)
+            if movers.any():
+                won |= movers & self.wins(symbol)
+        self.winner[won] = self.turn[won]
+        passing = active & ~won
+        self.turn[passing] = np.where(self.turn[passing] == CROSS, NOUGHT, CROSS)
+        self._remove_random_marks(passing)
+        return won
+
+    def _remove_random_marks(self, boards: np.ndarray):
+        own = self.cells == self.turn[:, None]
+        counts = own.sum(axis=1)
+        removing = np.nonzero(boards & (counts >= self.dim))[0]
+        if len(removing) == 0:
+            return
+        rng = self._rng[removing]
+        choice = (_splitmix64(rng) % counts[removing].astype(np.uint64)).astype(np.int64)
+        self._rng[removing] = rng
+        self.cells[removing, _nth_true(own[removing], choice)] = EMPTY
+
+    def to_tic_tac_toe(self, board: int, size=(600, 600)) -> TicTacToe:
+        tic_tac_toe = TicTacToe(size, self.dim, [Player(symbol) for symbol in Symbol.values()], self.win_length)
+        tic_tac_toe.marks = [Mark(tic_tac_toe.grid.cell(int(index)), SYMBOLS[int(self.cells[board, index])])
+                             for index in np.nonzero(self.cells[board])[0]]
+        tic_tac_toe.turn = SYMBOLS[int(self.turn[board])]
+        return tic_tac_toe
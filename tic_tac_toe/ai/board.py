@@ -0,0 +1,152 @@
+from functools import cache
+from typing import List, Optional, Tuple
+from ..model import TicTacToe, Cell, Symbol, Lines, winning_lines, zobrist_keys, Symmetries, symmetries
+
+SMALL_BOARD_CELLS = 64
+
+class Rules:
+    def __init__(self, dim: int, win_length: int):
+        self.dim = dim
+        self.win_length = win_length
+        self.full = (1 << dim * dim) - 1
+        self.first_column = sum(1 << x * dim for x in range(dim))
+        self.last_column = self.first_column << (dim - 1)
+        self.zobrist = zobrist_keys(dim)
+        self.symmetries: Symmetries = symmetries(dim)
+        # the whole line table is only worth building (and scanning) on small boards
+        self.lines: Optional[Lines] = winning_lines(dim, win_length) if dim * dim <= SMALL_BOARD_CELLS else None
+        self.masks = self.lines.masks if self.lines is not None else None
+        self.order = sorted(range(dim * dim), key=lambda i: self._centrality(i))
+
+    def __repr__(self):
+        return f'<{type(self).__name__}(dim={self.dim}, win_length={self.win_length})>'
+
+    def _centrality(self, index: int) -> float:
+        x, y = divmod(index, self.dim)
+        center = (self.dim - 1) / 2
+        return abs(x - center) + abs(y - center)
+
+@cache
+def rules(dim: int, win_length: int) -> Rules:
+    return Rules(dim, win_length)
+
+class Board:
+    __slots__ = ('rules', 'crosses', 'noughts', 'turn', 'key')
+
+    def __init__(self, rules: Rules, crosses: int=0, noughts: int=0, turn: Symbol=Symbol.CROSS, key: int=None):
+        self.rules = rules
+        self.crosses = crosses
+        self.noughts = noughts
+        self.turn = turn
+        self.key = key if key is not None else self._compute_key()
+
+    def __eq__(self, other: 'Board'):
+        return isinstance(other, Board) and self.rules is other.rules and self.crosses == other.crosses and \
+            self.noughts == other.noughts and self.turn is other.turn
+
+    def __hash__(self):
+        return self.key
+
+    def __repr__(self):
+        return f'<{type(self).__name__}(rules={self.rules}, crosses={self.crosses:#x}, noughts={self.noughts:#x}, turn={self.turn!r})>'
+
+    @classmethod
+    def from_tic_tac_toe(cls, tic_tac_toe: TicTacToe) -> 'Board':
+        return cls(
+            rules(tic_tac_toe.grid.dim, tic_tac_toe.grid.win_length),
+            tic_tac_toe.bitboard(Symbol.CROSS),
+            tic_tac_toe.bitboard(Symbol.NOUGHT),
+            tic_tac_toe.turn,
+            tic_tac_toe.position_key
+        )
+
+    @property
+    def mine(self) -> int:
+        return self.crosses if self.turn.is_cross else self.noughts
+
+    @property
+    def theirs(self) -> int:
+        return self.noughts if self.turn.is_cross else self.crosses
+
+    @property
+    def occupied(self) -> int:
+        return self.crosses | self.noughts
+
+    def cell(self, index: int) -> Cell:
+        return Cell(*divmod(index, self.rules.dim))
+
+    def index(self, cell: Cell) -> int:
+        return cell.x * self.rules.dim + cell.y
+
+    def moves(self) -> List[int]:
+        occupied = self.occupied
+        if self.rules.lines is not None or not occupied:
+            return [index for index in self.rules.order if not occupied >> index & 1]
+        # on large boards only the cells next to existing marks are worth considering
+        return list(bits(self._neighbours(occupied) & ~occupied))
+
+    def place(self, index: int) -> 'Board':
+        bit = 1 << index
+        key = self.key ^ self.rules.zobrist.cells[self.turn][index]
+        if self.turn.is_cross:
+            return Board(self.rules, self.crosses | bit, self.noughts, self.turn, key)
+        return Board(self.rules, self.crosses, self.noughts | bit, self.turn, key)
+
+    def remove(self, index: int) -> 'Board':
+        mask = ~(1 << index)
+        key = self.key ^ self.rules.zobrist.cells[self.turn][index]
+        if self.turn.is_cross:
+            return Board(self.rules, self.crosses & mask, self.noughts, self.turn, key)
+        return Board(self.rules, self.crosses, self.noughts & mask, self.turn, key)
+
+    def pass_turn(self) -> 'Board':
+        turn = Symbol.NOUGHT if self.turn.is_cross else Symbol.CROSS
+        return Board(self.rules, self.crosses, self.noughts, turn, self.key ^ self.rules.zobrist.turn)
+
+    def canonical(self) -> Tuple[int, int]:
+        return self.rules.symmetries.canonical(self.crosses, self.noughts, self.turn.is_nought)
+
+    def removals(self) -> List[int]:
+        # mirrors TicTacToe.remove_random_mark: each of these marks is removed with the same probability
+        mine = self.mine
+        if mine.bit_count() >= self.rules.dim:
+            return list(bits(mine))
+        return []
+
+    def wins(self, index: int) -> bool:
+        mine = self.mine
+        if self.rules.masks is not None:
+            masks = self.rules.masks
+            return any(mine & masks[line] == masks[line] for line in self.rules.lines.through[index])
+        dim, win_length = self.rules.dim, self.rules.win_length
+        x, y = divmod(index, dim)
+        for dx, dy in Lines.DIRECTIONS:
+            count = 1
+            for sign in (1, -1):
+                i, j = x + sign * dx, y + sign * dy
+                while count < win_length and 0 <= i < dim and 0 <= j < dim and mine >> (i * dim + j) & 1:
+                    count += 1
+                    i, j = i + sign * dx, j + sign * dy
+            if count >= win_length:
+                return True
+        return False
+
+    def _neighbours(self, occupied: int) -> int:
+        rules = self.rules
+        spread = occupied | (occupied << 1) & ~rules.first_column | (occupied >> 1) & ~rules.last_column
+        return (spread | spread << rules.dim | spread >> rules.dim) & rules.full
+
+    def _compute_key(self) -> int:
+        zobrist = self.rules.zobrist
+        key = zobrist.turn if self.turn.is_nought else 0
+        for index in bits(self.crosses):
+            key ^= zobrist.cells[Symbol.CROSS][index]
+        for index in bits(self.noughts):
+            key ^= zobrist.cells[Symbol.NOUGHT][index]
+        return key
+
+def bits(value: int):
+    while value:
+        low = value & -value
+        yield low.bit_length() - 1
+        value ^= low
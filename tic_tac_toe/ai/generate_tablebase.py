@@ -0,0 +1,15 @@
+from argparse import ArgumentParser
+from .tablebase import generate
+
+# a module of its own: the package imports tablebase eagerly, so running that one with -m would load it twice
+def main():
+    ap = ArgumentParser(prog="python -m " + __name__, description="Solve every reachable position and write a tablebase")
+    ap.add_argument("output", help="Path of the tablebase file to write")
+    ap.add_argument("--dim", type=int, default=3, help="Number of cells per side of the grid")
+    ap.add_argument("--max-states", type=int, default=200_000, dest="max_states",
+                    help="Give up when more canonical positions than this are reachable")
+    args = ap.parse_args()
+    generate(args.output, args.dim, args.max_states)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from ..log import logger
+from ..model import TicTacToe, Cell, Symbol
+from .alphabeta import AlphaBetaSearch, WIN
+from .board import Board
+from .tablebase import Tablebase
+
+@dataclass(frozen=True)
+class Hint:
+    cell: Optional[Cell]
+    value: float
+    symbol: Symbol
+
+HintCallback = Callable[[Hint], None]
+
+def _normalise(value: float) -> float:
+    # chance nodes average the outcomes, so the search value is close to the expected result times WIN
+    return max(-1.0, min(1.0, value / WIN))
+
+class HintService:
+    def __init__(self, time_budget: float=0.2, cache_size: int=4096, workers: int=2, tablebase: Optional[Tablebase]=None):
+        self.logger = logger("HintService")
+        self.time_budget = time_budget
+        self.cache_size = cache_size
+        # answers the positions it has solved exactly, without searching
+        self.tablebase = tablebase
+        self._cache: OrderedDict[Tuple, Tuple[Optional[int], float]] = OrderedDict()
+        # callbacks waiting for a position that is already being searched, with the transform of their board
+        self._pending: Dict[Tuple, List[Tuple[Board, int, HintCallback]]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hint")
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._cache)
+
+    def request(self, tic_tac_toe: TicTacToe, callback: HintCallback, symbol: Optional[Symbol]=None) -> bool:
+        # the snapshot is immutable, the search runs on a worker thread: returns whether the hint was answered at once
+        if symbol is not None and symbol is not tic_tac_toe.turn:
+            # hints are the best move of the player in turn, so there is none for the other one
+            self._notify(callback, Hint(None, 0.0, symbol))
+            return True
+        board = Board.from_tic_tac_toe(tic_tac_toe)
+        canonical, transform = board.canonical()
+        key = (board.rules.dim, board.rules.win_length, canonical)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                result = self._cache[key]
+            else:
+                self.misses += 1
+                result = None
+                waiting = key in self._pending
+                self._pending.setdefault(key, []).append((board, transform, callback))
+        if result is not None:
+            self._notify(callback, self._hint(board, transform, *result))
+            return True
+        if not waiting:
+            self._executor.submit(self._search, key, board, transform)
+        return False
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _search(self, key: Tuple, board: Board, transform: int):
+        try:
+            solved = self.tablebase.lookup(board) if self.tablebase is not None else None
+            if solved is not None:
+                move, value = solved
+            else:
+                strategy = self._strategy(board)
+                moves = board.moves()
+                move = strategy.best_move(board) if moves else None
+                value = _normalise(strategy.value) if moves else 0.0
+            result = (board.rules.symmetries.transform_index(transform, move) if move is not None else None, value)
+        except Exception as exception:
+            self.logger.warning(f"Hint search failed: {exception}")
+            result = (None, 0.0)
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            waiting = self._pending.pop(key, [])
+        for board, transform, callback in waiting:
+            self._notify(callback, self._hint(board, transform, *result))
+
+    def _notify(self, callback: HintCallback, hint: Hint):
+        # a failing callback (e.g. of a peer that left) must not deprive the others waiting for the same position
+        try:
+            callback(hint)
+        except Exception as exception:
+            self.logger.warning(f"Hint callback failed: {exception}")
+
+    def _strategy(self, board: Board) -> AlphaBetaSearch:
+        # one search per worker thread and rule set, so that transposition tables are never shared
+        strategies = self._local.__dict__.setdefault("strategies", {})
+        rules = board.rules
+        if rules not in strategies:
+            strategies[rules] = AlphaBetaSearch(time_budget=self.time_budget)
+        return strategies[rules]
+
+    def _hint(self, board: Board, transform: int, move: Optional[int], value: float) -> Hint:
+        cell = board.cell(board.rules.symmetries.restore_index(transform, move)) if move is not None else None
+        return Hint(cell, value, board.turn)
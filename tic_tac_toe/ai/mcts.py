@@ -0,0 +1,144 @@
+import math
+import random
+import time
+from typing import Dict, List, Optional
+from ..model import Symbol
+from .board import Board
+from .strategy import Strategy
+
+class _Node:
+    __slots__ = ('board', 'visits', 'value', 'children')
+
+    def __init__(self, board: Board):
+        self.board = board
+        self.visits = 0
+        self.value = 0.0
+        self.children: Dict[int, '_Node'] = {}
+
+    @property
+    def last_mover(self) -> Symbol:
+        return Symbol.NOUGHT if self.board.turn.is_cross else Symbol.CROSS
+
+    def update(self, winner: Optional[Symbol]):
+        self.visits += 1
+        self.value += 0.5 if winner is None else 1.0 if winner is self.last_mover else 0.0
+
+class _DecisionNode(_Node):
+    __slots__ = ('untried',)
+
+    def __init__(self, board: Board, rng: random.Random):
+        super().__init__(board)
+        self.untried: List[int] = board.moves()
+        rng.shuffle(self.untried)
+
+class _ChanceNode(_Node):
+    __slots__ = ('outcomes',)
+
+    def __init__(self, board: Board):
+        super().__init__(board)
+        self.outcomes = board.removals()
+
+class _TerminalNode(_Node):
+    __slots__ = ()
+
+class MonteCarloTreeSearch(Strategy):
+    def __init__(self, playouts: int=2000, time_budget: float=0.05, exploration: float=math.sqrt(2),
+                 playout_depth: int=64, seed: int=None):
+        super().__init__()
+        self.playouts = playouts
+        self.time_budget = time_budget
+        self.exploration = exploration
+        self.playout_depth = playout_depth
+        self.random = random.Random(seed)
+        self._root: Optional[_DecisionNode] = None
+
+    def best_move(self, board: Board) -> int:
+        deadline = time.perf_counter() + self.time_budget
+        root = self._reuse(board) or _DecisionNode(board, self.random)
+        self._root = root
+        playouts = 0
+        while playouts < self.playouts and time.perf_counter() < deadline:
+            self._iterate(root)
+            playouts += 1
+        if not root.children:
+            return board.moves()[0]
+        move, child = max(root.children.items(), key=lambda item: item[1].visits)
+        self.logger.debug(f"Best move {board.cell(move)} (win rate: {child.value / child.visits:.2f}, "
+                          f"playouts: {playouts}, root visits: {root.visits})")
+        return move
+
+    def _iterate(self, root: _DecisionNode):
+        node: _Node = root
+        path: List[_Node] = [root]
+        while True:
+            if isinstance(node, _TerminalNode):
+                winner = node.last_mover
+                break
+            if isinstance(node, _ChanceNode):
+                # the rolling rule removes one of the marks uniformly at random
+                removed = self.random.choice(node.outcomes)
+                child = node.children.get(removed)
+                if child is None:
+                    child = node.children[removed] = _DecisionNode(node.board.remove(removed), self.random)
+                    path.append(child)
+                    winner = self._playout(child.board)
+                    break
+                path.append(child)
+                node = child
+                continue
+            if node.untried:
+                move = node.untried.pop()
+                child = node.children[move] = self._expand(node.board, move)
+                path.append(child)
+                if isinstance(child, _ChanceNode):
+                    node = child
+                    continue
+                winner = child.last_mover if isinstance(child, _TerminalNode) else self._playout(child.board)
+                break
+            if not node.children:
+                winner = None
+                break
+            node = self._select(node)
+            path.append(node)
+        for visited in path:
+            visited.update(winner)
+
+    def _expand(self, board: Board, move: int) -> _Node:
+        child = board.place(move)
+        if child.wins(move):
+            return _TerminalNode(child.pass_turn())
+        child = child.pass_turn()
+        if child.removals():
+            return _ChanceNode(child)
+        return _DecisionNode(child, self.random)
+
+    def _select(self, node: _DecisionNode) -> _Node:
+        log_visits = math.log(node.visits)
+        exploration = self.exploration
+        return max(node.children.values(),
+                   key=lambda child: child.value / child.visits + exploration * math.sqrt(log_visits / child.visits))
+
+    def _playout(self, board: Board) -> Optional[Symbol]:
+        for _ in range(self.playout_depth):
+            moves = board.moves()
+            if not moves:
+                return None
+            move = self.random.choice(moves)
+            board = board.place(move)
+            if board.wins(move):
+                return board.turn
+            board = board.pass_turn()
+            removals = board.removals()
+            if removals:
+                board = board.remove(self.random.choice(removals))
+        return None
+
+    def _reuse(self, board: Board) -> Optional[_DecisionNode]:
+        # look for the new position among the nodes reachable with our last move and the opponent's reply
+        frontier: List[_Node] = [self._root] if self._root is not None else []
+        for _ in range(5):
+            for node in frontier:
+                if isinstance(node, _DecisionNode) and node.board == board:
+                    return node
+            frontier = [child for node in frontier for child in node.children.values()]
+        return None
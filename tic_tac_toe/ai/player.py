@@ -0,0 +1,22 @@
+from ..controller import InputHandler, ControlEvent
+from ..model import TicTacToe, Symbol
+from .strategy import Strategy
+
+class BotInputHandler(InputHandler):
+    def __init__(self, tic_tac_toe: TicTacToe, symbol: Symbol, strategy: Strategy):
+        self._tic_tac_toe = tic_tac_toe
+        self.symbol = symbol
+        self.strategy = strategy
+        self._moved = False
+
+    @property
+    def in_turn(self) -> bool:
+        return self._tic_tac_toe.turn is self.symbol
+
+    def handle_inputs(self, dt: float=None):
+        if not self.in_turn:
+            self._moved = False
+        elif not self._moved and self._tic_tac_toe.is_player_lobby_full():
+            # the turn only changes once the placement has been handled, so post a single move per turn
+            self._moved = True
+            self.post_event(ControlEvent.MARK_PLACED, cell=self.strategy.choose(self._tic_tac_toe), symbol=self.symbol)
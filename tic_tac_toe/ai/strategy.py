@@ -0,0 +1,23 @@
+import random
+from ..log import logger
+from ..model import TicTacToe, Cell
+from .board import Board
+
+class Strategy:
+    def __init__(self):
+        self.logger = logger(type(self).__name__)
+
+    def choose(self, tic_tac_toe: TicTacToe) -> Cell:
+        board = Board.from_tic_tac_toe(tic_tac_toe)
+        return board.cell(self.best_move(board))
+
+    def best_move(self, board: Board) -> int:
+        raise NotImplementedError
+
+class RandomStrategy(Strategy):
+    def __init__(self, seed: int=None):
+        super().__init__()
+        self.random = random.Random(seed)
+
+    def best_move(self, board: Board) -> int:
+        return self.random.choice(board.moves())
@@ -0,0 +1,144 @@
+import mmap
+import struct
+from functools import cache
+from typing import Dict, List, Optional, Tuple
+from ..log import logger
+from ..model import TicTacToe, Cell, Symbol, symmetries
+from .board import Board, Rules, rules, bits
+from .strategy import Strategy
+
+MAGIC = b"TTTB"
+VERSION = 1
+HEADER = struct.Struct('<4sBBBxI')
+RECORD = struct.Struct('<QhB')
+NO_MOVE = 0xff
+VALUE_SCALE = 32767
+DISCOUNT = 0.99
+
+def generate(path: str, dim: int=3, max_states: int=200_000, tolerance: float=1e-5, max_iterations: int=10_000):
+    log = logger("Tablebase")
+    game_rules: Rules = rules(dim, dim)
+    assert game_rules.masks is not None and 2 * dim * dim + 1 <= 64, f"A tablebase can't be built for a {dim}x{dim} grid"
+    symmetry = symmetries(dim)
+    cells = dim * dim
+    masks, through = game_rules.masks, game_rules.lines.through
+    start, _ = symmetry.canonical(0, 0, False)
+    ids: Dict[int, int] = {start: 0}
+    keys: List[int] = [start]
+    # for each position and each legal move: None for an immediate win, or the equally likely successors
+    transitions: List[List[Tuple[int, Optional[Tuple[int, ...]]]]] = []
+    while len(transitions) < len(keys):
+        crosses, noughts, nought_turn = symmetry.decode(keys[len(transitions)])
+        mine, theirs = (noughts, crosses) if nought_turn else (crosses, noughts)
+        moves = []
+        for move in range(cells):
+            if (mine | theirs) >> move & 1:
+                continue
+            placed = mine | 1 << move
+            if any(placed & masks[line] == masks[line] for line in through[move]):
+                moves.append((move, None))
+                continue
+            # the opponent is now in turn: the rolling rule may remove one of their marks at random
+            outcomes = [theirs & ~(1 << index) for index in bits(theirs)] if theirs.bit_count() >= dim else [theirs]
+            successors = []
+            for outcome in outcomes:
+                next_crosses, next_noughts = (placed, outcome) if not nought_turn else (outcome, placed)
+                key, _ = symmetry.canonical(next_crosses, next_noughts, not nought_turn)
+                if key not in ids:
+                    if len(keys) >= max_states:
+                        raise ValueError(f"More than {max_states} positions to solve on a {dim}x{dim} grid")
+                    ids[key] = len(keys)
+                    keys.append(key)
+                successors.append(ids[key])
+            moves.append((move, tuple(successors)))
+        transitions.append(moves)
+    log.info(f"Enumerated {len(keys)} canonical positions on a {dim}x{dim} grid")
+    values = [0.0] * len(keys)
+    best_moves = [NO_MOVE] * len(keys)
+    for iteration in range(max_iterations):
+        delta = 0.0
+        for state, moves in enumerate(transitions):
+            best, best_move = (0.0, NO_MOVE) if not moves else (-2.0, NO_MOVE)
+            for move, successors in moves:
+                value = 1.0 if successors is None else \
+                    -DISCOUNT * sum(values[successor] for successor in successors) / len(successors)
+                if value > best:
+                    best, best_move = value, move
+            delta = max(delta, abs(best - values[state]))
+            values[state], best_moves[state] = best, best_move
+        if delta < tolerance:
+            break
+    log.info(f"Solved {len(keys)} positions in {iteration + 1} iterations (residual: {delta})")
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, dim, dim, len(keys)))
+        for state in sorted(range(len(keys)), key=keys.__getitem__):
+            file.write(RECORD.pack(keys[state], round(values[state] * VALUE_SCALE), best_moves[state]))
+
+class Tablebase:
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.dim, self.win_length, self.size = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a tablebase (version {VERSION})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return self.size
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def supports(self, board: Board) -> bool:
+        return board.rules.dim == self.dim and board.rules.win_length == self.win_length
+
+    def lookup(self, board: Board) -> Optional[Tuple[Optional[int], float]]:
+        if not self.supports(board):
+            return None
+        key, transform = board.canonical()
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            record_key, value, move = RECORD.unpack_from(self._map, HEADER.size + middle * RECORD.size)
+            if record_key < key:
+                low = middle + 1
+            elif record_key > key:
+                high = middle
+            else:
+                move = board.rules.symmetries.restore_index(transform, move) if move != NO_MOVE else None
+                return move, value / VALUE_SCALE
+        return None
+
+    def probe(self, tic_tac_toe: TicTacToe) -> Optional[Tuple[Optional[Cell], float]]:
+        board = Board.from_tic_tac_toe(tic_tac_toe)
+        result = self.lookup(board)
+        if result is None:
+            return None
+        move, value = result
+        return (board.cell(move) if move is not None else None), value
+
+@cache
+def open_tablebase(path: str) -> Tablebase:
+    # shared by every strategy and hint service of the process, and kept open (read-only) for its lifetime
+    return Tablebase(path)
+
+class TablebaseStrategy(Strategy):
+    def __init__(self, tablebase: Tablebase, fallback: Strategy=None):
+        super().__init__()
+        self.tablebase = tablebase
+        self.fallback = fallback
+
+    def best_move(self, board: Board) -> int:
+        result = self.tablebase.lookup(board)
+        if result is not None and result[0] is not None:
+            return result[0]
+        if self.fallback is None:
+            raise ValueError(f"Position not in the tablebase: {board}")
+        return self.fallback.best_move(board)
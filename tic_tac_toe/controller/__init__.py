@@ -3,7 +3,8 @@ from ..model import *
 from dataclasses import dataclass, field
 from enum import Enum
 from tic_tac_toe.model import Symbol
-from typing import Set
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from .bus import EventBus
 
 class LobbyEvent(Enum):
     CREATE_GAME = pygame.event.custom_type()
@@ -20,14 +21,14 @@ class LobbyEvent(Enum):
 
     @classmethod
     def is_lobby_event(cls, event: pygame.event.Event) -> bool:
-        return any(lobby_event.matches(event) for lobby_event in cls.all())
+        return event.type in _LOBBY_EVENTS
 
     @classmethod
     def by_value(cls, value: int) -> 'LobbyEvent':
-        for lobby_event in cls.all():
-            if lobby_event.value == value:
-                return lobby_event
-        raise KeyError(f"{cls.__name__} with value {value} not found")
+        try:
+            return _LOBBY_EVENTS[value]
+        except KeyError:
+            raise KeyError(f"{cls.__name__} with value {value} not found") from None
 
     def matches(self, event) -> bool:
         if isinstance(event, pygame.event.Event):
@@ -38,6 +39,8 @@ class LobbyEvent(Enum):
             return event == self.value
         return False
 
+_LOBBY_EVENTS: Dict[int, LobbyEvent] = {lobby_event.value: lobby_event for lobby_event in LobbyEvent}
+
 class ControlEvent(Enum):
     PLAYER_CREATE_GAME = pygame.event.custom_type()
     PLAYER_JOIN_GAME = pygame.event.custom_type()
@@ -48,6 +51,8 @@ class ControlEvent(Enum):
     MARK_PLACED = pygame.event.custom_type()
     CHANGE_TURN = pygame.event.custom_type()
     TIME_ELAPSED = pygame.event.custom_type()
+    HINT_REQUESTED = pygame.event.custom_type()
+    HINT = pygame.event.custom_type()
 
     @classmethod
     def all(cls) -> Set['ControlEvent']:
@@ -59,14 +64,14 @@ class ControlEvent(Enum):
 
     @classmethod
     def is_control_event(cls, event: pygame.event.Event) -> bool:
-        return any(control_event.matches(event) for control_event in cls.all())
+        return event.type in _CONTROL_EVENTS
 
     @classmethod
     def by_value(cls, value: int) -> 'ControlEvent':
-        for control_event in cls.all():
-            if control_event.value == value:
-                return control_event
-        raise KeyError(f"{cls.__name__} with value {value} not found")
+        try:
+            return _CONTROL_EVENTS[value]
+        except KeyError:
+            raise KeyError(f"{cls.__name__} with value {value} not found") from None
 
     def matches(self, event) -> bool:
         if isinstance(event, pygame.event.Event):
@@ -77,10 +82,13 @@ class ControlEvent(Enum):
             return event == self.value
         return False
 
+_CONTROL_EVENTS: Dict[int, ControlEvent] = {control_event.value: control_event for control_event in ControlEvent}
+
 class PlayerAction(Enum):
     PLACE_MARK = 0
     STOP = 1
     QUIT = 2
+    HINT = 3
 
     @classmethod
     def all(cls) -> Set['PlayerAction']:
@@ -91,6 +99,7 @@ class ActionMap:
     place_mark: int
     click_point: Vector2 = field(default_factory=Vector2)
     quit: int = pygame.K_ESCAPE
+    hint: int = pygame.K_h
     name: str = 'custom'
 
     def to_key_map(self):
@@ -110,19 +119,38 @@ def create_event(event: pygame.event.Event | ControlEvent, **kwargs) -> pygame.e
         event = pygame.event.Event(event.type, data)
     return event
 
-def post_event(event: pygame.event.Event | LobbyEvent | ControlEvent, **kwargs) -> pygame.event.Event:
+def post_event(event: pygame.event.Event | LobbyEvent | ControlEvent, bus: Optional[EventBus]=None, **kwargs) -> pygame.event.Event:
     event = create_event(event, **kwargs)
+    if bus is not None:
+        return bus.post(event)
     pygame.event.post(event)
     return event
 
+def get_events(types: Tuple[int, ...], bus: Optional[EventBus]=None) -> List[pygame.event.Event]:
+    return bus.get(types) if bus is not None else pygame.event.get(types)
+
+Dispatcher = Callable[[object, pygame.event.Event], None]
+
+def _dispatcher(name: str, with_game: bool=True, with_payload: bool=True) -> Dispatcher:
+    # the handler is looked up by name on each call, so that overrides in subclasses and instances are honoured
+    if with_game and with_payload:
+        return lambda handler, event: getattr(handler, name)(handler._tic_tac_toe, **event.dict)
+    elif with_game:
+        return lambda handler, event: getattr(handler, name)(handler._tic_tac_toe)
+    elif with_payload:
+        return lambda handler, event: getattr(handler, name)(**event.dict)
+    return lambda handler, event: getattr(handler, name)()
+
 class InputHandler:
-    INPUT_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN)
+    INPUT_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEWHEEL, pygame.KEYDOWN)
+    # events go through pygame's queue unless a bus is given
+    bus: Optional[EventBus] = None
 
     def create_event(self, event: pygame.event.Event | LobbyEvent | ControlEvent, **kwargs) -> pygame.event.Event:
         return create_event(event, **kwargs)
 
     def post_event(self, event: pygame.event.Event | LobbyEvent | ControlEvent, **kwargs) -> pygame.event.Event:
-        return post_event(event, **kwargs)
+        return post_event(event, self.bus, **kwargs)
 
     def mouse_clicked(self):
         pass
@@ -130,26 +158,37 @@ class InputHandler:
     def time_elapsed(self, dt: float):
         self.post_event(ControlEvent.TIME_ELAPSED, dt=dt)
 
+    def hint_requested(self, symbol: Symbol):
+        self.post_event(ControlEvent.HINT_REQUESTED, symbol=symbol)
+
     def handle_inputs(self, dt=None):
         pass
 
 class LobbyEventHandler:
     LOBBY_EVENTS = tuple(LobbyEvent.all_types())
+    # event type -> (event, dispatcher): a single lookup per event, however many handlers are registered
+    HANDLERS: Dict[int, Tuple[LobbyEvent, Dispatcher]] = {}
+    bus: Optional[EventBus] = None
+
+    @classmethod
+    def register(cls, event: LobbyEvent, name: str):
+        # copied, so that registering on a subclass leaves its parents untouched
+        cls.HANDLERS = {**cls.HANDLERS, event.value: (event, _dispatcher(name, with_game=False))}
 
     def handle_events(self):
-        for event in pygame.event.get(self.LOBBY_EVENTS):
-            if LobbyEvent.CREATE_GAME.matches(event):
-                self.on_create_game(**event.dict)
-            elif LobbyEvent.DELETE_GAME.matches(event):
-                self.on_delete_game(**event.dict)
-            elif LobbyEvent.JOIN_GAME.matches(event):
-                self.on_join_game(**event.dict)
+        for event in get_events(self.LOBBY_EVENTS, self.bus):
+            self.handle_event(event)
+
+    def handle_event(self, event: pygame.event.Event):
+        entry = self.HANDLERS.get(event.type)
+        if entry is not None:
+            entry[1](self, event)
 
     def create_event(self, event: pygame.event.Event | LobbyEvent, **kwargs) -> pygame.event.Event:
         return create_event(event, **kwargs)
 
     def post_event(self, event: pygame.event.Event | LobbyEvent, **kwargs) -> pygame.event.Event:
-        return post_event(event, **kwargs)
+        return post_event(event, self.bus, **kwargs)
 
     def on_create_game(self, **kwargs):
         pass
@@ -162,30 +201,36 @@ class LobbyEventHandler:
 
 class EventHandler:
     GAME_EVENTS = tuple(ControlEvent.all_types())
+    # event type -> (event, dispatcher): a single lookup per event, however many handlers are registered
+    HANDLERS: Dict[int, Tuple[ControlEvent, Dispatcher]] = {}
+    bus: Optional[EventBus] = None
+    # anything with a record(event) method: every handled event goes through it, whatever the role of the game
+    recorder = None
 
     def __init__(self, tic_tac_toe: TicTacToe):
         self._tic_tac_toe = tic_tac_toe
 
+    @classmethod
+    def register(cls, event: ControlEvent, name: str, with_game: bool=True, with_payload: bool=True):
+        # copied, so that registering on a subclass leaves its parents untouched
+        cls.HANDLERS = {**cls.HANDLERS, event.value: (event, _dispatcher(name, with_game, with_payload))}
+
     def handle_events(self):
-        for event in pygame.event.get(self.GAME_EVENTS):
-            if ControlEvent.PLAYER_CREATE_GAME.matches(event):
-                self.on_player_create_game()
-            elif ControlEvent.PLAYER_JOIN_GAME.matches(event):
-                self.on_player_join_game(**event.dict)
-            elif ControlEvent.PLAYER_JOIN.matches(event):
-                self.on_player_join(self._tic_tac_toe, **event.dict)
-            elif ControlEvent.PLAYER_LEAVE.matches(event):
-                self.on_player_leave(self._tic_tac_toe, **event.dict)
-            elif ControlEvent.GAME_START.matches(event):
-                self.on_game_start(self._tic_tac_toe)
-            elif ControlEvent.GAME_OVER.matches(event):
-                self.on_game_over(self._tic_tac_toe, **event.dict)
-            elif ControlEvent.MARK_PLACED.matches(event):
-                self.on_mark_placed(self._tic_tac_toe, **event.dict)
-            elif ControlEvent.CHANGE_TURN.matches(event):
-                self.on_change_turn(self._tic_tac_toe)
-            elif ControlEvent.TIME_ELAPSED.matches(event):
-                self.on_time_elapsed(self._tic_tac_toe, **event.dict)
+        for event in get_events(self.GAME_EVENTS, self.bus):
+            self.handle_event(event)
+
+    def handle_event(self, event: pygame.event.Event):
+        if self.recorder is not None:
+            self.recorder.record(event)
+        entry = self.HANDLERS.get(event.type)
+        if entry is not None:
+            entry[1](self, event)
+
+    def create_event(self, event: pygame.event.Event | ControlEvent, **kwargs) -> pygame.event.Event:
+        return create_event(event, **kwargs)
+
+    def post_event(self, event: pygame.event.Event | ControlEvent, **kwargs) -> pygame.event.Event:
+        return post_event(event, self.bus, **kwargs)
 
     def on_player_create_game(self):
         pass
@@ -213,3 +258,25 @@ class EventHandler:
 
     def on_time_elapsed(self, tic_tac_toe: TicTacToe, dt: float):
         pass
+
+    def on_hint_requested(self, tic_tac_toe: TicTacToe, symbol: Symbol, **kwargs):
+        pass
+
+    def on_hint(self, tic_tac_toe: TicTacToe, cell: Cell, value: float, symbol: Symbol):
+        pass
+
+LobbyEventHandler.register(LobbyEvent.CREATE_GAME, 'on_create_game')
+LobbyEventHandler.register(LobbyEvent.DELETE_GAME, 'on_delete_game')
+LobbyEventHandler.register(LobbyEvent.JOIN_GAME, 'on_join_game')
+
+EventHandler.register(ControlEvent.PLAYER_CREATE_GAME, 'on_player_create_game', with_game=False, with_payload=False)
+EventHandler.register(ControlEvent.PLAYER_JOIN_GAME, 'on_player_join_game', with_game=False)
+EventHandler.register(ControlEvent.PLAYER_JOIN, 'on_player_join')
+EventHandler.register(ControlEvent.PLAYER_LEAVE, 'on_player_leave')
+EventHandler.register(ControlEvent.GAME_START, 'on_game_start', with_payload=False)
+EventHandler.register(ControlEvent.GAME_OVER, 'on_game_over')
+EventHandler.register(ControlEvent.MARK_PLACED, 'on_mark_placed')
+EventHandler.register(ControlEvent.CHANGE_TURN, 'on_change_turn', with_payload=False)
+EventHandler.register(ControlEvent.TIME_ELAPSED, 'on_time_elapsed')
+EventHandler.register(ControlEvent.HINT_REQUESTED, 'on_hint_requested')
+EventHandler.register(ControlEvent.HINT, 'on_hint')
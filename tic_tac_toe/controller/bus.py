@@ -0,0 +1,50 @@
+import threading
+from collections import deque
+from typing import Deque, Iterable, List, Optional
+from pygame.event import Event
+
+class EventBus:
+    # a thread-safe replacement for pygame's event queue, for processes that have no display
+    def __init__(self):
+        self._queue: Deque[Event] = deque()
+        self._condition = threading.Condition()
+
+    def __len__(self):
+        with self._condition:
+            return len(self._queue)
+
+    def post(self, event: Event) -> Event:
+        with self._condition:
+            self._queue.append(event)
+            self._condition.notify_all()
+        return event
+
+    def get(self, types: Optional[int | Iterable[int]]=None) -> List[Event]:
+        # like pygame.event.get: removes and returns the queued events of the given types, in order;
+        # anything posted that is not an event is dropped, rather than left to wake every wait
+        with self._condition:
+            if types is None:
+                events = [event for event in self._queue if isinstance(event, Event)]
+                self._queue.clear()
+                return events
+            types = {types} if isinstance(types, int) else set(types)
+            events, others = [], deque()
+            for event in self._queue:
+                if isinstance(event, Event):
+                    (events if event.type in types else others).append(event)
+            self._queue = others
+            return events
+
+    def wait(self, timeout: Optional[float]=None, types: Optional[int | Iterable[int]]=None) -> bool:
+        # blocks until an event (of the given types) is queued or the timeout expires, without consuming anything;
+        # a caller that only consumes some types must pass them, or events left for nobody would wake it forever
+        types = None if types is None else {types} if isinstance(types, int) else set(types)
+        with self._condition:
+            if types is None:
+                return self._condition.wait_for(lambda: len(self._queue) > 0, timeout)
+            return self._condition.wait_for(
+                lambda: any(isinstance(event, Event) and event.type in types for event in self._queue), timeout)
+
+    def clear(self):
+        with self._condition:
+            self._queue.clear()
@@ -1,30 +1,62 @@
 from tic_tac_toe.controller import *
 
+# how far the arrow keys scroll, in screen pixels, and how much a wheel notch or +/- zooms
+SCROLL_STEP = 50
+ZOOM_STEP = 1.25
+SCROLL_KEYS = {
+    pygame.K_LEFT: (-SCROLL_STEP, 0),
+    pygame.K_RIGHT: (SCROLL_STEP, 0),
+    pygame.K_UP: (0, -SCROLL_STEP),
+    pygame.K_DOWN: (0, SCROLL_STEP),
+}
+ZOOM_KEYS = {
+    pygame.K_PLUS: ZOOM_STEP,
+    pygame.K_EQUALS: ZOOM_STEP,
+    pygame.K_KP_PLUS: ZOOM_STEP,
+    pygame.K_MINUS: 1 / ZOOM_STEP,
+    pygame.K_KP_MINUS: 1 / ZOOM_STEP,
+}
+
 class TicTacToeInputHandler(InputHandler):
-    def __init__(self, tic_tac_toe: TicTacToe):
+    def __init__(self, tic_tac_toe: TicTacToe, viewport: Viewport=None):
         self._tic_tac_toe = tic_tac_toe
+        # shared with the view, so that clicks land on the cells it shows
+        self.viewport = viewport or Viewport(tic_tac_toe.size.x, tic_tac_toe.size.y)
         self._command = ActionMap(PlayerAction.PLACE_MARK)
 
     def mouse_clicked(self):
         pos = self._command.click().__getattribute__("click_point")
-        self.post_event(ControlEvent.MARK_PLACED, cell=self._to_cell(pos), symbol=self._tic_tac_toe.turn)
+        cell = self._to_cell(pos)
+        if cell is not None:
+            self.post_event(ControlEvent.MARK_PLACED, cell=cell, symbol=self._tic_tac_toe.turn)
     
     def handle_inputs(self, dt: float=None, symbol: Symbol=None):
         for event in pygame.event.get(self.INPUT_EVENTS):
             match (event.type):
                 case pygame.MOUSEBUTTONDOWN:
-                    self.mouse_clicked()
+                    # the wheel also comes as buttons, and is handled as MOUSEWHEEL
+                    if event.button not in (pygame.BUTTON_WHEELUP, pygame.BUTTON_WHEELDOWN):
+                        self.mouse_clicked()
+                case pygame.MOUSEWHEEL:
+                    self.viewport.zoom_at(ZOOM_STEP ** event.y, *pygame.mouse.get_pos())
                 case pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         self.post_event(ControlEvent.PLAYER_LEAVE, symbol=symbol)
+                    elif event.key == self._command.hint:
+                        self.hint_requested(symbol or self._tic_tac_toe.turn)
+                    elif event.key in SCROLL_KEYS:
+                        self.viewport.scroll(*SCROLL_KEYS[event.key])
+                    elif event.key in ZOOM_KEYS:
+                        viewport = self.viewport
+                        viewport.zoom_at(ZOOM_KEYS[event.key], viewport.width / 2, viewport.height / 2)
+                    elif event.key == pygame.K_0:
+                        self.viewport.reset()
         if dt is not None:
             self.time_elapsed(dt)
 
-    def _to_cell(self, pos: Vector2) -> Cell:
-        cells_area_matrix = self._tic_tac_toe.config.cells_area_matrix
-        value = list(filter(lambda key: pos.x in range(cells_area_matrix[key][0][0], cells_area_matrix[key][0][1]) and \
-                    pos.y in range(cells_area_matrix[key][1][0], cells_area_matrix[key][1][1]), cells_area_matrix)).__getitem__(0)
-        return Cell(value[0], value[1])
+    def _to_cell(self, pos: Vector2) -> Optional[Cell]:
+        value = self._tic_tac_toe.config.cell_at(*self.viewport.to_world(pos.x, pos.y))
+        return Cell(value[0], value[1]) if value is not None else None
 
 class TicTacToeEventHandler(EventHandler):
     def on_player_create_game(self):
@@ -50,17 +82,17 @@ class TicTacToeEventHandler(EventHandler):
 
     def on_mark_placed(self, tic_tac_toe: TicTacToe, cell: Cell, symbol: Symbol):
         if tic_tac_toe.turn == symbol:
-            tic_tac_toe.place_mark(Mark(
+            placed = tic_tac_toe.place_mark(Mark(
                 cell=cell,
                 symbol=symbol,
                 size=(tic_tac_toe.size / tic_tac_toe.grid.dim),
-                position=tic_tac_toe.config.cells_symbol_position.get((cell.x, cell.y))
+                position=tic_tac_toe.config.cell_symbol_position(cell.x, cell.y)
             ))
-            winner = tic_tac_toe.check_game_end()
+            winner = tic_tac_toe.check_game_end(last_move=cell if placed else None)
             if winner:
-                post_event(ControlEvent.GAME_OVER, symbol=winner.symbol)
+                self.post_event(ControlEvent.GAME_OVER, symbol=winner.symbol)
             else:
-                post_event(ControlEvent.CHANGE_TURN)
+                self.post_event(ControlEvent.CHANGE_TURN)
 
     def on_change_turn(self, tic_tac_toe: TicTacToe):
         tic_tac_toe.change_turn()
@@ -70,6 +102,6 @@ class TicTacToeEventHandler(EventHandler):
         tic_tac_toe.update(dt)
 
 class TicTacToeLocalController(TicTacToeInputHandler, TicTacToeEventHandler):
-    def __init__(self, tic_tac_toe: TicTacToe):
-        TicTacToeInputHandler.__init__(self, tic_tac_toe)
+    def __init__(self, tic_tac_toe: TicTacToe, viewport: Viewport=None):
+        TicTacToeInputHandler.__init__(self, tic_tac_toe, viewport)
         TicTacToeEventHandler.__init__(self, tic_tac_toe)
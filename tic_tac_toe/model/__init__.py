@@ -1,15 +1,58 @@
 import random
 from .grid import *
 from .game_object import *
+from .zobrist import ZobristKeys, zobrist_keys
+from .symmetry import Symmetries, symmetries
 from ..utils import *
-from typing import List, Any
+from dataclasses import dataclass, field
+from typing import List, Any, Callable, Optional, Tuple
+
+@dataclass
+class TicTacToeDiff:
+    added: List[Mark] = field(default_factory=list)
+    removed: List[Mark] = field(default_factory=list)
+    changed: List[Mark] = field(default_factory=list)
+    turn_changed: bool = False
+    players_added: List[Player] = field(default_factory=list)
+    players_removed: List[Player] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed or self.turn_changed or \
+            self.players_added or self.players_removed)
+
+    @property
+    def cells(self) -> List[Cell]:
+        return [mark.cell for mark in self.added + self.removed + self.changed]
+
+class MoveKind(Enum):
+    PLACE = 0
+    REMOVE = 1
+    CHANGE_TURN = 2
+
+@dataclass(frozen=True, slots=True)
+class Move:
+    kind: MoveKind
+    mark: Mark = None
+
+# undo only reaches this many moves back: a long match must not keep its whole journal in memory
+HISTORY_LIMIT = 1024
 
 class TicTacToe(Sized):
-    def __init__(self, size, dim: int=Settings.dim, players: List[Player]=[]):
+    def __init__(self, size, dim: int=Settings.dim, players: List[Player]=[], win_length: int=None, seed: int=None):
+        # the rolling rule draws from a per-game generator, so that a seeded game can be replayed
+        self.random = random.Random(seed)
+        # bumped by every change of the position, the players or the grid (not by the passing of time)
+        self.revision = 0
+        self._listeners: List[Callable[[Optional[Cell]], None]] = []
         self.size = Vector2(size)
-        self.config = Config(self.size.x/dim, self.size.y/dim)
+        self.config = Config(self.size.x/dim, self.size.y/dim, dim)
         self.players = players
-        self.grid = Grid(dim) if dim is not None else Grid()
+        self._marks = dict()
+        self._turn = Symbol.CROSS
+        self._journal: List[Move] = list()
+        self._cursor = 0
+        self._replaying = False
+        self.grid = Grid(dim, win_length) if dim is not None else Grid()
         self.marks = list()
         self.turn: Symbol = Symbol.CROSS
         self.updates = 0
@@ -28,7 +71,7 @@ class TicTacToe(Sized):
             self.time == value.time
 
     def __hash__(self):
-        return hash((self.size, self.config, self.grid, tuple(self.players), tuple(self.marks), self.turn, self.updates, self.time))
+        return hash((self.position_key, self.updates, self.time))
 
     def __repr__(self):
         return (f'<{type(self).__name__}('
@@ -42,6 +85,9 @@ class TicTacToe(Sized):
                 f'turn={repr(self.turn)}'
                 f')>')
 
+    def __str__(self):
+        return f'{type(self).__name__.lower()}#{id(self)}'
+
     @property
     def players(self) -> List[Player]:
         return list(self._players)
@@ -52,11 +98,13 @@ class TicTacToe(Sized):
         for player in players:
             assert isinstance(player, Player), f"Invalid symbol for a player: {player.symbol}"
             self._players.append(player)
+        self._changed()
 
     def add_player(self, player: Player):
         if len(list(filter(lambda p: p.symbol == player.symbol, self.players))) != 0:
             raise ValueError(f"A player with symbol '{player.symbol}' has already joined the game!")
         self._players.append(player)
+        self._changed()
         self.logger.debug(f"Add {player}")
 
     def player(self, player: Player) -> Player:
@@ -74,68 +122,162 @@ class TicTacToe(Sized):
         return len(self.players) == Settings.lobby_size
 
     @property
-    def marks(self) -> List[Mark]:
-        return sorted(self._marks, key=lambda m: (m.cell.x, m.cell.y))
+    def grid(self) -> Grid:
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid: Grid):
+        self._grid = grid
+        self._changed(None)
+        if self.config.dim != grid.dim:
+            self.config.cell_width_size, self.config.cell_height_size = self.size.x / grid.dim, self.size.y / grid.dim
+            self.config.dim = grid.dim
+        self._index_marks()
+
+    @property
+    def turn(self) -> Symbol:
+        return self._turn
+
+    @turn.setter
+    def turn(self, turn: Symbol):
+        if turn is not self._turn:
+            self._key ^= self._zobrist.turn
+            self._changed()
+        self._turn = turn
+
+    @property
+    def position_key(self) -> int:
+        return self._key
+
+    def canonical_position(self) -> Tuple[int, int]:
+        # the same key for every rotation and reflection of the position, and the transform that leads to it
+        return symmetries(self.grid.dim).canonical(
+            self._bitboards[Symbol.CROSS], self._bitboards[Symbol.NOUGHT], self._turn is Symbol.NOUGHT)
+
+    @property
+    def marks(self) -> Tuple[Mark, ...]:
+        # immutable, so that callers cannot corrupt the cached view behind the index's back
+        if self._sorted_marks is None:
+            self._sorted_marks = tuple(sorted(self._marks.values(), key=lambda m: (m.cell.x, m.cell.y)))
+        return self._sorted_marks
     
     @marks.setter
     def marks(self, marks) -> List[Mark]:
-        self._marks = []
+        self._marks = dict()
         for mark in marks:
             assert isinstance(mark, Mark), f"Invalid mark: {mark}"
-            self._marks.append(mark)
+            self._marks[mark.cell] = mark
+        self._changed(None)
+        self._index_marks()
+        self.clear_history()
 
+    def bitboard(self, symbol: Symbol) -> int:
+        return self._bitboards[symbol]
+
+    @property
+    def occupied(self) -> int:
+        return self._bitboards[Symbol.NOUGHT] | self._bitboards[Symbol.CROSS]
 
     def place_mark(self, mark: Mark) -> bool:
-        if list(map(lambda m: m.cell, self.marks)).__contains__(mark.cell):
+        if mark.cell in self._marks:
             self.logger.debug(f"{mark.cell} is already marked.")
             return False
         else:
-            self._marks.append(mark)
+            self._marks[mark.cell] = mark
+            self._sorted_marks = None
+            self._bitboards[mark.symbol] |= self._bit(mark.cell)
+            self._count_lines(mark, 1)
+            self._key ^= self._zobrist_key(mark)
+            self._changed(mark.cell)
+            self._record(Move(MoveKind.PLACE, mark))
             self.logger.debug(f"Added {mark} to {self} on {mark.cell}")
             return True
 
     def has_mark(self, cell: Cell) -> bool:
         assert cell is not None, "Cell not provided, but necessary"
-        return len(list(filter(lambda m: m.cell == cell, self.marks))) > 0
+        return cell in self._marks
 
     def get_mark(self, cell: Cell) -> Mark:
-        if self.has_mark(cell):
-            return list(filter(lambda m: m.cell == cell, self.marks)).__getitem__(0)
+        if cell in self._marks:
+            return self._marks[cell]
         else:
             raise ValueError(f"{cell} is not marked")
 
     def remove_mark(self, cell: Cell):
-        self._marks.remove(self.get_mark(cell))
+        mark = self.get_mark(cell)
+        del self._marks[cell]
+        self._sorted_marks = None
+        self._bitboards[mark.symbol] &= ~self._bit(cell)
+        self._count_lines(mark, -1)
+        self._key ^= self._zobrist_key(mark)
+        self._changed(cell)
+        self._record(Move(MoveKind.REMOVE, mark))
         self.logger.debug(f"Removed mark on {cell} from {self}")
 
     def remove_random_mark(self):
-        turn_marks = self.get_crosses() if self.turn.is_cross else self.get_noughts()
-        if len(turn_marks) >= self.grid.dim:
-            r = random.randint(0, len(turn_marks) - 1)
+        if self.count_marks(self.turn) >= self.grid.dim:
+            turn_marks = self.get_marks(self.turn)
+            r = self.random.randint(0, len(turn_marks) - 1)
             mark = turn_marks.__getitem__(r)
             self.remove_mark(mark.cell)
 
+    def count_marks(self, symbol: Symbol) -> int:
+        return self._bitboards[symbol].bit_count()
+
+    def get_marks(self, symbol: Symbol) -> List[Mark]:
+        if not self._bitboards[symbol]:
+            return list()
+        return list(filter(lambda m: m.symbol is symbol, self.marks))
+
     def get_noughts(self) -> List[Mark]:
-        return list(filter(lambda m: m.symbol is Symbol.NOUGHT, self.marks))
+        return self.get_marks(Symbol.NOUGHT)
 
     def get_crosses(self) -> List[Mark]:
-        return list(filter(lambda m: m.symbol is Symbol.CROSS, self.marks))
-
-    def check_game_end(self) -> Player:
-        def has_won(player: Player) -> bool:
-            cells_marked = list(map(lambda m: m.cell, self.get_noughts() if player.symbol.is_nought else self.get_crosses()))
-            for row in self._get_rows():
-                if len(cells_marked).__ge__(self.grid.dim) and all(list(map(lambda cell: cell in cells_marked, row))):
-                    return True
-            for col in self._get_columns():
-                if len(cells_marked).__ge__(self.grid.dim) and all(list(map(lambda cell: cell in cells_marked, col))):
-                    return True
-            return len(cells_marked).__ge__(self.grid.dim) and \
-                (all(list(map(lambda cell: cell in cells_marked, self._get_diagonal()))) or \
-                all(list(map(lambda cell: cell in cells_marked, self._get_antidiagonal()))))
+        return self.get_marks(Symbol.CROSS)
+
+    def check_game_end(self, last_move: Cell=None) -> Player:
+        # removals never complete a line, so after a placement only the lines through it can win
+        if last_move is not None and self.has_mark(last_move):
+            symbol = self.get_mark(last_move).symbol
+            if self._wins_through(last_move, symbol):
+                return self._winner(symbol)
+        else:
+            for player in self.players:
+                if self._has_won(player.symbol):
+                    return self._winner(player.symbol)
+        self.logger.debug(f"Game not ended")
+        return None
+
+    def _has_won(self, symbol: Symbol) -> bool:
+        if self._line_counts is None:
+            return any(self._wins_through(mark.cell, symbol) for mark in self.get_marks(symbol))
+        return any(count == self.grid.win_length for count in self._line_counts[symbol])
+
+    def _wins_through(self, cell: Cell, symbol: Symbol) -> bool:
+        if self._line_counts is not None:
+            counts = self._line_counts[symbol]
+            return any(counts[line] == self.grid.win_length for line in self.grid.lines.through[self.grid.index(cell)])
+        # sliding window: count the consecutive marks of the symbol around the cell, in each direction
+        for dx, dy in Lines.DIRECTIONS:
+            count = 1
+            for sign in (1, -1):
+                x, y = cell.x + sign * dx, cell.y + sign * dy
+                while count < self.grid.win_length and self._is_marked_by(x, y, symbol):
+                    count += 1
+                    x, y = x + sign * dx, y + sign * dy
+            if count >= self.grid.win_length:
+                return True
+        return False
 
+    def _is_marked_by(self, x: int, y: int, symbol: Symbol) -> bool:
+        if not (0 <= x < self.grid.dim and 0 <= y < self.grid.dim):
+            return False
+        mark = self._marks.get(Cell(x, y))
+        return mark is not None and mark.symbol is symbol
+
+    def _winner(self, symbol: Symbol) -> Player:
         for player in self.players:
-            if has_won(player):
+            if player.symbol == symbol:
                 self.logger.debug(f"The {player} has won")
                 return player
         self.logger.debug(f"Game not ended")
@@ -143,7 +285,7 @@ class TicTacToe(Sized):
 
     def reset_grid(self):
         self.marks = list()
-        self.grid = Grid(self.grid.dim)
+        self.grid = Grid(self.grid.dim, self.grid.win_length)
         self.logger.debug(f"Reset grid")
 
     def update(self, delta_time: float):
@@ -156,53 +298,144 @@ class TicTacToe(Sized):
 
     def change_turn(self):
         self.turn = Symbol.CROSS if self.turn.is_nought else Symbol.NOUGHT
+        self._record(Move(MoveKind.CHANGE_TURN))
         self.logger.debug(f"Change turn. Now the player '{self.turn.value}' is in turn")
 
-    def override(self, other: 'TicTacToe'):
-        if self == other:
-            return
-        self.logger.debug(f"Overriding TicTacToe status")
+    def override(self, other: 'TicTacToe') -> 'TicTacToeDiff':
+        diff = TicTacToeDiff()
         self.size = other.size
         self.config = other.config
         self.updates = other.updates
         self.time = other.time
-        self.turn = other.turn
-        my_marks = self.marks
-        other_marks = other.marks
-        for other_mark in other_marks:
-            if not my_marks.__contains__(other_mark):
+        if self.grid != other.grid:
+            self.grid = other.grid
+        if self.turn is not other.turn:
+            self.turn = other.turn
+            diff.turn_changed = True
+        for cell, mark in list(self._marks.items()):
+            other_mark = other._marks.get(cell)
+            if other_mark is None:
+                self.remove_mark(cell)
+                diff.removed.append(mark)
+            elif other_mark.symbol is not mark.symbol:
+                self.remove_mark(cell)
                 self.place_mark(other_mark)
-        for mark in my_marks:
-            if not other_marks.__contains__(mark):
-                self.remove_mark(mark.cell)
-            else:
-                self.get_mark(mark.cell).override(other.get_mark(mark.cell))
-        my_players = self.players
-        other_players = other.players
-        for other_player in other_players:
-            if not my_players.__contains__(other_player):
+                diff.changed.append(other_mark)
+            elif other_mark != mark:
+                mark.override(other_mark)
+                diff.changed.append(mark)
+        for cell, other_mark in other._marks.items():
+            if cell not in self._marks:
+                self.place_mark(other_mark)
+                diff.added.append(other_mark)
+        my_players = set(self._players)
+        other_players = set(other._players)
+        for other_player in other._players:
+            if other_player not in my_players:
                 self.add_player(other_player)
-        for player in my_players:
-            if not other_players.__contains__(player):
-                self.remove_player_by_symbol(player.symbol)
-
-    def _get_diagonal(self) -> List[Cell]:
-        return list(filter(lambda c: c.x == c.y, self.grid.cells))
-
-    def _get_antidiagonal(self) -> List[Cell]:
-        reversed_cells = self._get_rows().copy()
-        return [reversed_cells[i][-(i+1)] for i in range(len(reversed_cells))]
-
-    def _get_columns(self) -> List[List[Cell]]:
-        res = list()
-        for i in range(self.grid.dim):
-            col = list(filter(lambda c: c.x == i, self.grid.cells))
-            res.append(col)
-        return res
-
-    def _get_rows(self) -> List[List[Cell]]:
-        res = list()
-        for j in range(self.grid.dim):
-            row = list(filter(lambda c: c.y == j, self.grid.cells))
-            res.append(row)
-        return res
+                diff.players_added.append(other_player)
+        for player in my_players - other_players:
+            self.remove_player_by_symbol(player.symbol)
+            diff.players_removed.append(player)
+        if diff:
+            self._changed(*diff.cells)
+            self.clear_history()
+            self.logger.debug(f"Overridden TicTacToe status: {diff}")
+        return diff
+
+    @property
+    def history(self) -> List[Move]:
+        return self._journal[:self._cursor]
+
+    @property
+    def can_undo(self) -> bool:
+        return self._cursor > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return self._cursor < len(self._journal)
+
+    def undo(self) -> Move:
+        if not self.can_undo:
+            raise ValueError("No move to undo")
+        self._cursor -= 1
+        move = self._journal[self._cursor]
+        self._replay(move, undo=True)
+        return move
+
+    def redo(self) -> Move:
+        if not self.can_redo:
+            raise ValueError("No move to redo")
+        move = self._journal[self._cursor]
+        self._cursor += 1
+        self._replay(move, undo=False)
+        return move
+
+    def clear_history(self):
+        self._journal.clear()
+        self._cursor = 0
+
+    def _record(self, move: Move):
+        if self._replaying:
+            return
+        if self._cursor < len(self._journal):
+            del self._journal[self._cursor:]
+        self._journal.append(move)
+        self._cursor += 1
+        if len(self._journal) > HISTORY_LIMIT:
+            excess = len(self._journal) - HISTORY_LIMIT
+            del self._journal[:excess]
+            self._cursor -= excess
+
+    def _replay(self, move: Move, undo: bool):
+        self._replaying = True
+        try:
+            if move.kind is MoveKind.CHANGE_TURN:
+                self.change_turn()
+            elif (move.kind is MoveKind.PLACE) != undo:
+                self.place_mark(move.mark)
+            else:
+                self.remove_mark(move.mark.cell)
+        finally:
+            self._replaying = False
+
+    def add_listener(self, listener: Callable[[Optional[Cell]], None]):
+        # called with each cell whose mark changes, or with None when the whole grid does
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Optional[Cell]], None]):
+        self._listeners.remove(listener)
+
+    def _changed(self, *cells: Optional[Cell]):
+        self.revision += 1
+        for listener in self._listeners:
+            for cell in cells:
+                listener(cell)
+
+    def _bit(self, cell: Cell) -> int:
+        return 1 << self.grid.index(cell)
+
+    def _zobrist_key(self, mark: Mark) -> int:
+        return self._zobrist.cells[mark.symbol][self.grid.index(mark.cell)]
+
+    def _index_marks(self):
+        self._sorted_marks = None
+        self._zobrist: ZobristKeys = zobrist_keys(self.grid.dim)
+        self._key = self._zobrist.turn if self._turn.is_nought else 0
+        self._bitboards = {symbol: 0 for symbol in Symbol.values()}
+        # per-line counters only pay off when lines span the whole grid: k-in-a-row boards
+        # would need a counter for every window, so they are checked with a sliding window instead
+        self._line_counts = None
+        if self.grid.win_length == self.grid.dim:
+            self._line_counts = {symbol: [0] * len(self.grid.lines) for symbol in Symbol.values()}
+        for mark in self._marks.values():
+            self._bitboards[mark.symbol] |= self._bit(mark.cell)
+            self._count_lines(mark, 1)
+            self._key ^= self._zobrist_key(mark)
+
+    def _count_lines(self, mark: Mark, delta: int):
+        if self._line_counts is None:
+            return
+        counts = self._line_counts[mark.symbol]
+        for line in self.grid.lines.through[self.grid.index(mark.cell)]:
+            counts[line] += delta
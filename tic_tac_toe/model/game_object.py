@@ -1,3 +1,4 @@
+import sys
 from typing import Any, List
 from pygame.math import Vector2
 from enum import Enum
@@ -5,6 +6,7 @@ from ..log import logger
 from dataclasses import dataclass
 
 class Sized:
+    __slots__ = ()
 
     @property
     def width(self) -> float:
@@ -15,6 +17,7 @@ class Sized:
         return self.size.y # type: ignore[attr-defined]
 
 class Positioned:
+    __slots__ = ()
 
     @property
     def x(self) -> float:
@@ -25,11 +28,13 @@ class Positioned:
         return self.position.y # type: ignore[attr-defined]
 
 class GameObject(Sized, Positioned):
+    __slots__ = ('_size', '_position', 'name')
+    logger = logger("GameObject")
+
     def __init__(self, size: Vector2, position: Vector2=None, name: str=None):
         self._size = Vector2(size)
         self._position = Vector2(position) if position is not None else Vector2()
-        self.name = name or self.__class__.__name__.lower()
-        self.logger = logger("GameObject")
+        self.name = sys.intern(name or self.__class__.__name__.lower())
 
     def __eq__(self, other: 'GameObject'):
         return isinstance(other, type(self)) and \
@@ -92,7 +97,7 @@ class Symbol(Enum):
     def values(cls) -> List['Symbol']:
         return list(cls.__members__.values())
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     symbol: Symbol
 
@@ -106,6 +111,7 @@ class Player:
         return f'<{type(self).__name__}(id={id(self)}, symbol={self.symbol})>'
 
 class Mark(GameObject):
+    __slots__ = ('cell', 'symbol')
     from .grid import Cell
 
     def __init__(self, cell: Cell, symbol: Symbol, size: Vector2=Vector2(0), position: Vector2=None, name: str=None):
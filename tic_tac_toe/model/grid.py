@@ -1,22 +1,102 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cache, cached_property
 from ..utils import Settings
-from typing import List
+from typing import Dict, List, Tuple
 
-@dataclass
+_CELLS: Dict[Tuple[int, int], 'Cell'] = {}
+
+@dataclass(frozen=True, slots=True, init=False)
 class Cell:
     x: int
     y: int
+    # cells key most of the model's dicts and sets, so their hash is computed once rather than on every lookup
+    _hash: int = field(repr=False, compare=False)
+
+    def __new__(cls, x: int, y: int):
+        cell = _CELLS.get((x, y))
+        if cell is None:
+            # interned instances are shared, so they are only ever initialised here, with int coordinates
+            if int(x) != x or int(y) != y:
+                raise ValueError(f"Cell coordinates must be integers, got ({x}, {y})")
+            x, y = int(x), int(y)
+            cell = _CELLS.get((x, y))
+            if cell is None:
+                cell = _CELLS[(x, y)] = object.__new__(cls)
+                object.__setattr__(cell, 'x', x)
+                object.__setattr__(cell, 'y', y)
+                object.__setattr__(cell, '_hash', hash((x, y)))
+        return cell
+
+    def __init__(self, x: int, y: int):
+        pass
 
     def __hash__(self):
-        return hash((self.x, self.y))
+        return self._hash
+
+    def __reduce__(self):
+        return type(self), (self.x, self.y)
+
+class Lines:
+    DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+    def __init__(self, dim: int, win_length: int):
+        self.dim = dim
+        self.win_length = win_length
+        self.cells: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple((x + k * dx) * dim + (y + k * dy) for k in range(win_length))
+            for dx, dy in self.DIRECTIONS
+            for x in range(dim)
+            for y in range(dim)
+            if 0 <= x + (win_length - 1) * dx < dim and 0 <= y + (win_length - 1) * dy < dim
+        )
+        through = [[] for _ in range(dim * dim)]
+        for line, indexes in enumerate(self.cells):
+            for index in indexes:
+                through[index].append(line)
+        self.through: Tuple[Tuple[int, ...], ...] = tuple(map(tuple, through))
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __repr__(self):
+        return f'<{type(self).__name__}(dim={self.dim}, win_length={self.win_length}, lines={len(self)})>'
+
+    @cached_property
+    def masks(self) -> Tuple[int, ...]:
+        return tuple(sum(1 << index for index in line) for line in self.cells)
+
+@cache
+def winning_lines(dim: int, win_length: int) -> Lines:
+    return Lines(dim, win_length)
 
 class Grid:
     dim: int
-    cells: List[Cell]
+    win_length: int
 
-    def __init__(self, dim : Settings=Settings.dim):
+    def __init__(self, dim : Settings=Settings.dim, win_length: int=None):
         self.dim = dim
-        self.cells = list(Cell(i, j) for i in range(self.dim) for j in range(self.dim))
+        self.win_length = win_length or dim
+        assert 0 < self.win_length <= self.dim, f"Invalid win length {self.win_length} for a {self.dim}x{self.dim} grid"
 
     def __eq__(self, other: 'Grid'):
-        return self.dim == other.dim and self.cells.__eq__(other.cells)
+        return isinstance(other, Grid) and self.dim == other.dim and self.win_length == other.win_length
+
+    def __contains__(self, cell: Cell) -> bool:
+        return 0 <= cell.x < self.dim and 0 <= cell.y < self.dim
+
+    def __len__(self):
+        return self.dim * self.dim
+
+    @property
+    def cells(self) -> List[Cell]:
+        return list(Cell(i, j) for i in range(self.dim) for j in range(self.dim))
+
+    @property
+    def lines(self) -> Lines:
+        return winning_lines(self.dim, self.win_length)
+
+    def index(self, cell: Cell) -> int:
+        return cell.x * self.dim + cell.y
+
+    def cell(self, index: int) -> Cell:
+        return Cell(*divmod(index, self.dim))
@@ -0,0 +1,73 @@
+from functools import cache
+from typing import List, Tuple
+from .grid import Cell
+
+# the 8 symmetries of the square (D4): identity, the 3 rotations and the 4 reflections
+TRANSFORMS = 8
+IDENTITY = 0
+# bitboards longer than this are transformed mark by mark instead of byte by byte
+BYTE_TABLE_CELLS = 64
+
+def _images(dim: int) -> List[Tuple[int, ...]]:
+    last = dim - 1
+    images = (
+        lambda x, y: (x, y), lambda x, y: (y, last - x), lambda x, y: (last - x, last - y), lambda x, y: (last - y, x),
+        lambda x, y: (last - x, y), lambda x, y: (x, last - y), lambda x, y: (y, x), lambda x, y: (last - y, last - x),
+    )
+    return [tuple(x * dim + y for x, y in (image(*divmod(index, dim)) for index in range(dim * dim))) for image in images]
+
+class Symmetries:
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.cells = dim * dim
+        # permutations[t][index] is where transform t moves the cell at index, inverses[t] moves it back
+        self.permutations = _images(dim)
+        self.inverses = [tuple(sorted(range(self.cells), key=permutation.__getitem__)) for permutation in self.permutations]
+        # byte-wise lookup tables, so that transforming a small bitboard costs one lookup per 8 cells
+        self._bytes = [[[sum(1 << permutation[chunk * 8 + bit] for bit in range(8) if value >> bit & 1 and chunk * 8 + bit < self.cells)
+                         for value in range(256)] for chunk in range((self.cells + 7) // 8)] for permutation in self.permutations] \
+            if self.cells <= BYTE_TABLE_CELLS else None
+
+    def __repr__(self):
+        return f'<{type(self).__name__}(dim={self.dim})>'
+
+    def transform(self, transform: int, bitboard: int) -> int:
+        result = 0
+        if self._bytes is not None:
+            for table in self._bytes[transform]:
+                result |= table[bitboard & 0xff]
+                bitboard >>= 8
+            return result
+        permutation = self.permutations[transform]
+        while bitboard:
+            lowest = bitboard & -bitboard
+            result |= 1 << permutation[lowest.bit_length() - 1]
+            bitboard ^= lowest
+        return result
+
+    def transform_index(self, transform: int, index: int) -> int:
+        return self.permutations[transform][index]
+
+    def restore_index(self, transform: int, index: int) -> int:
+        return self.inverses[transform][index]
+
+    def transform_cell(self, transform: int, cell: Cell) -> Cell:
+        return Cell(*divmod(self.permutations[transform][cell.x * self.dim + cell.y], self.dim))
+
+    def restore_cell(self, transform: int, cell: Cell) -> Cell:
+        return Cell(*divmod(self.inverses[transform][cell.x * self.dim + cell.y], self.dim))
+
+    def key(self, crosses: int, noughts: int, nought_turn: bool=False) -> int:
+        return crosses | noughts << self.cells | int(nought_turn) << 2 * self.cells
+
+    def decode(self, key: int) -> Tuple[int, int, bool]:
+        mask = (1 << self.cells) - 1
+        return key & mask, key >> self.cells & mask, bool(key >> 2 * self.cells)
+
+    def canonical(self, crosses: int, noughts: int, nought_turn: bool=False) -> Tuple[int, int]:
+        # the smallest key among the 8 images, with the transform that maps the position onto it
+        return min((self.key(self.transform(t, crosses), self.transform(t, noughts), nought_turn), t) for t in range(TRANSFORMS))
+
+@cache
+def symmetries(dim: int) -> Symmetries:
+    return Symmetries(dim)
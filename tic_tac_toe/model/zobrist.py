@@ -0,0 +1,20 @@
+import random
+from functools import cache
+from typing import Dict, Tuple
+from .game_object import Symbol
+
+class ZobristKeys:
+    def __init__(self, dim: int):
+        rng = random.Random(dim)
+        self.dim = dim
+        self.cells: Dict[Symbol, Tuple[int, ...]] = {
+            symbol: tuple(rng.getrandbits(64) for _ in range(dim * dim)) for symbol in Symbol.values()
+        }
+        self.turn = rng.getrandbits(64)
+
+    def __repr__(self):
+        return f'<{type(self).__name__}(dim={self.dim})>'
+
+@cache
+def zobrist_keys(dim: int) -> ZobristKeys:
+    return ZobristKeys(dim)
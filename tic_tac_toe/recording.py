@@ -0,0 +1,114 @@
+import gzip
+import time
+from typing import Iterator, List, Optional, Tuple
+from pygame.event import Event
+from .controller import ControlEvent, create_event
+from .controller.local import TicTacToeEventHandler
+from .model import TicTacToe, Player, Symbol
+from .remote.presentation import serialize, deserialize
+from .utils import Settings
+
+VERSION = 1
+MIRRORED_EVENTS = (ControlEvent.MARK_PLACED.value, ControlEvent.PLAYER_JOIN.value, ControlEvent.PLAYER_LEAVE.value)
+
+class EventRecorder:
+    # one gzipped line per event: the seconds since the recording started, a tab, then the serialized event
+    def __init__(self, path: str, tic_tac_toe: TicTacToe, seed: Optional[int], remote: bool=False):
+        self._file = gzip.open(path, 'wt', encoding='utf-8')
+        self._start = time.perf_counter()
+        self.events = 0
+        self._file.write(serialize({
+            "version": VERSION,
+            "size": list(tic_tac_toe.size),
+            "dim": tic_tac_toe.grid.dim,
+            "win_length": tic_tac_toe.grid.win_length,
+            "players": [player.symbol for player in tic_tac_toe.players],
+            "seed": seed,
+            "remote": remote,
+        }) + "\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def record(self, event: Event):
+        self._file.write(f"{time.perf_counter() - self._start:.6f}\t{serialize(event)}\n")
+        self.events += 1
+
+    def close(self):
+        self._file.close()
+
+def read_recording(path: str) -> Tuple[dict, Iterator[Tuple[float, Event]]]:
+    file = gzip.open(path, 'rt', encoding='utf-8')
+    header = deserialize(file.readline())
+    if header.get("version") != VERSION:
+        file.close()
+        raise ValueError(f"{path} is not a recording (version {VERSION})")
+
+    def events() -> Iterator[Tuple[float, Event]]:
+        with file:
+            for line in file:
+                timestamp, payload = line.split("\t", 1)
+                yield float(timestamp), deserialize(payload)
+
+    return header, events()
+
+class EventReplayer(TicTacToeEventHandler):
+    def __init__(self, path: str):
+        header, self._events = read_recording(path)
+        super().__init__(TicTacToe(
+            size=header["size"],
+            dim=header["dim"],
+            players=[Player(symbol) for symbol in header["players"]],
+            win_length=header["win_length"],
+            seed=header["seed"]
+        ))
+        self.remote = header.get("remote", False)
+        self.events = 0
+        self.winner: Optional[Symbol] = None
+
+    @property
+    def tic_tac_toe(self) -> TicTacToe:
+        return self._tic_tac_toe
+
+    def post_event(self, event: Event | ControlEvent, **kwargs) -> Event:
+        # the events that handlers derive from the recorded ones are in the recording too
+        return create_event(event, **kwargs)
+
+    def handle_event(self, event: Event):
+        # a terminal does not apply its own moves and joins: they reach it through the states of the coordinator
+        if self.remote and event.type in MIRRORED_EVENTS:
+            return
+        super().handle_event(event)
+
+    def on_time_elapsed(self, tic_tac_toe: TicTacToe, dt: float, status: TicTacToe=None): # type: ignore[override]
+        if status is None:
+            super().on_time_elapsed(tic_tac_toe, dt)
+        else:
+            tic_tac_toe.override(status)
+
+    def on_game_over(self, tic_tac_toe: TicTacToe, symbol: Symbol):
+        self.winner = symbol
+
+    def run(self, real_time: bool=False) -> TicTacToe:
+        start = time.perf_counter()
+        for timestamp, event in self._events:
+            if real_time:
+                time.sleep(max(0.0, start + timestamp - time.perf_counter()))
+            self.handle_event(event)
+            self.events += 1
+        return self.tic_tac_toe
+
+def main_replay(path: str, real_time: bool=False, settings: Settings=None):
+    from .log import logging
+    if settings is not None and not settings.debug:
+        logging.disable(logging.DEBUG)
+    replayer = EventReplayer(path)
+    start = time.perf_counter()
+    tic_tac_toe = replayer.run(real_time)
+    seconds = time.perf_counter() - start
+    winner = f"player '{replayer.winner.value}' won" if replayer.winner else "no winner"
+    print(f"Replayed {replayer.events} events in {seconds:.3f}s ({replayer.events / max(seconds, 1e-9):.0f} events/s), "
+          f"{winner}, {len(tic_tac_toe.marks)} marks on the grid")
@@ -7,16 +7,20 @@ from tic_tac_toe.log import logger
 from tic_tac_toe import TicTacToeGame
 from tic_tac_toe.remote import *
 from tic_tac_toe.utils import Settings
-from tic_tac_toe.model import TicTacToe
+from tic_tac_toe.model import TicTacToe, Cell
 from tic_tac_toe.model.game_object import Symbol
-from tic_tac_toe.controller import LobbyEvent, ControlEvent
+from tic_tac_toe.controller import LobbyEvent, ControlEvent, EventBus
 from tic_tac_toe.remote.tcp import TcpClient, TcpConnection, TcpServer, Address
 from tic_tac_toe.remote.presentation import serialize, deserialize
+from tic_tac_toe.ai.hints import HintService
+from tic_tac_toe.ai.tablebase import open_tablebase
 import threading
 
 
 DEFAULT_HOST = "localhost"
 DEFAULT_PORT = 12345
+# how long the server loops sleep when no event arrives
+IDLE_TIMEOUT = 0.1
 
 
 class LobbyCoordinator():
@@ -24,9 +28,10 @@ class LobbyCoordinator():
     def __init__(self, settings: Settings=None):
         self.logger = logger("LobbyCoordinator")
         self.settings = settings
+        self.bus = EventBus()
         self.controller = self.create_controller()
+        self.controller.bus = self.bus
         self.server = TcpServer(self.settings.port or DEFAULT_PORT, self._on_new_connection)
-        self.clock = pygame.time.Clock()
         self.running = True
         self._lock = threading.RLock()
         self.__coordinators: dict[int, Address] = {}
@@ -93,21 +98,22 @@ class LobbyCoordinator():
 
     def kill_process_by_id(self, game_id: int):
         with self._lock:
-            process: Process = self.__processes.pop(game_id, default=None)
+            process: Process = self.__processes.pop(game_id, None)
             if process is not None and process.is_alive():
                 process.kill()
 
     def before_run(self):
-        pygame.init()
+        pass
 
     def after_run(self):
-        pygame.quit()
+        pass
 
     def run(self):
         try:
             self.before_run()
             while self.running:
-                self.controller.handle_events()
+                if self.bus.wait(IDLE_TIMEOUT, self.controller.LOBBY_EVENTS):
+                    self.controller.handle_events()
         finally:
             self.after_run()
 
@@ -130,7 +136,7 @@ class LobbyCoordinator():
         match event:
             case ConnectionEvent.MESSAGE:
                 if payload is not None:
-                    self.__handle_message(deserialize(payload))
+                    self.__handle_message(deserialize(payload), connection=connection)
             case ConnectionEvent.CLOSE:
                 self.logger.debug(f"Connection with coordinator {connection.remote_address} closed")
             case ConnectionEvent.ERROR:
@@ -138,27 +144,46 @@ class LobbyCoordinator():
 
     def __handle_message(self, message: Any, **kwargs):
         self.logger.debug(f"Message: {message}")
+        # anything else (e.g. chat lines of terminals still in the lobby) would never be consumed
+        if not isinstance(message, pygame.event.Event) or not LobbyEvent.is_lobby_event(message):
+            self.logger.debug(f"Ignore message that is not a lobby event: {message}")
+            return
         if LobbyEvent.CREATE_GAME.matches(message) or LobbyEvent.JOIN_GAME.matches(message):
             message.connection = kwargs["connection"]
-        pygame.event.post(message)
+        self.bus.post(message)
 
 class TicTacToeCoordinator(TicTacToeGame):
 
     def __init__(self, game_id: int, settings: Settings=None):
         settings = settings or Settings()
         self.logger = logger(f"Coordinator {game_id}")
+        self.bus = EventBus()
         super().__init__(settings)
+        self.controller.bus = self.bus
         self.game_id = game_id
         self.server = TcpServer(Address.any_local_port().port, self._on_new_connection)
         self._peers: set[Address] = set()
         self._lock = threading.RLock()
+        tablebase = open_tablebase(self.settings.tablebase) if self.settings.tablebase else None
+        self.hints = HintService(self.settings.hint_time_budget, self.settings.hint_cache_size, tablebase=tablebase)
 
     def create_view(coordinator: 'TicTacToeCoordinator'):
         from tic_tac_toe.view import ShowNothingTicTacToeView
         from tic_tac_toe.controller.local import ControlEvent
 
         class SendToPeersTicTacToeView(ShowNothingTicTacToeView):
+            def __init__(self, tic_tac_toe: TicTacToe):
+                super().__init__(tic_tac_toe)
+                self._revision = None
+                self._sent_at = 0.0
+
             def render(self):
+                # unchanged states are only sent as periodic keyframes, which keep the peers' clocks in sync
+                interval = coordinator.settings.keyframe_interval
+                keyframe = interval and self._tic_tac_toe.time - self._sent_at >= interval
+                if self._tic_tac_toe.revision == self._revision and not keyframe:
+                    return
+                self._revision, self._sent_at = self._tic_tac_toe.revision, self._tic_tac_toe.time
                 event = coordinator.controller.create_event(ControlEvent.TIME_ELAPSED, dt=coordinator.dt, status=self._tic_tac_toe)
                 coordinator._broadcast_to_all_peers(event)
 
@@ -187,11 +212,27 @@ class TicTacToeCoordinator(TicTacToeGame):
                 self.post_event(LobbyEvent.DELETE_GAME, game_id=coordinator.game_id)
                 coordinator.stop()
 
+            def on_hint_requested(self, tic_tac_toe: TicTacToe, symbol: Symbol, **kwargs):
+                connection: TcpConnection = kwargs.get("connection")
+                if connection is not None:
+                    # answered from the cache right away, or later from a worker thread: the game loop never waits,
+                    # and the answer goes back through the bus, so that only the game thread writes to the peers
+                    coordinator.hints.request(tic_tac_toe, lambda hint: self.post_event(
+                        ControlEvent.HINT, cell=hint.cell, value=hint.value, symbol=hint.symbol, connection=connection), symbol)
+
+            def on_hint(self, tic_tac_toe: TicTacToe, cell: Cell, value: float, symbol: Symbol, **kwargs):
+                connection: TcpConnection = kwargs.get("connection")
+                if connection is not None:
+                    try:
+                        connection.send(serialize(self.create_event(ControlEvent.HINT, cell=cell, value=value, symbol=symbol)))
+                    except OSError as exception:
+                        coordinator.logger.debug(f"Could not send the hint: {exception}")
+
             def handle_inputs(self, dt: float=None):
                 self.time_elapsed(dt)
 
             def handle_events(self):
-                game_over_events: List[Event] = pygame.event.get(ControlEvent.GAME_OVER.value)
+                game_over_events: List[Event] = coordinator.bus.get(ControlEvent.GAME_OVER.value)
                 if len(game_over_events) > 0:
                     event = game_over_events.pop()
                     coordinator._broadcast_to_all_peers(event)
@@ -200,11 +241,18 @@ class TicTacToeCoordinator(TicTacToeGame):
 
         return Controller(coordinator.tic_tac_toe)
 
+    @property
+    def render_rate(self) -> int:
+        return self.settings.broadcast_rate
+
+    def before_run(self):
+        pass
+
     def at_each_run(self):
         pass
 
     def after_run(self):
-        super().after_run()
+        self.hints.close()
         self.server.close()
 
     @property
@@ -260,17 +308,21 @@ class TicTacToeCoordinator(TicTacToeGame):
                 self.remove_peer((connection.remote_address.host, connection.remote_address.port))
 
     def __handle_message(self, message: Any, **kwargs):
-        if isinstance(message, pygame.event.Event):
-            if ControlEvent.PLAYER_JOIN.matches(message):
+        if isinstance(message, pygame.event.Event) and not ControlEvent.is_control_event(message):
+            # nothing in the game loop would ever consume it
+            self.logger.debug(f"Ignore event that is not a control event: {message}")
+        elif isinstance(message, pygame.event.Event):
+            if ControlEvent.PLAYER_JOIN.matches(message) or ControlEvent.HINT_REQUESTED.matches(message):
                 message.connection = kwargs["connection"]
             elif ControlEvent.PLAYER_LEAVE.matches(message):
                 self._broadcast_to_all_peers(message)
-            pygame.event.post(message)
+            self.bus.post(message)
         elif isinstance(message, str):
             self._broadcast_to_all_peers(message)
             self.logger.debug(f"Received message: {message}")
 
 class TicTacToeTerminal(TicTacToeGame):
+    remote = True
 
     def __init__(self, symbol: Symbol, create_game: bool=False, game_id: Optional[int]=None, settings: Settings=None):
         settings = settings or Settings()
@@ -292,12 +344,14 @@ class TicTacToeTerminal(TicTacToeGame):
 
         class Controller(TicTacToeInputHandler, EventHandler):
             def __init__(self, tic_tac_toe: TicTacToe):
-                TicTacToeInputHandler.__init__(self, tic_tac_toe)
+                TicTacToeInputHandler.__init__(self, tic_tac_toe, terminal.view.viewport)
 
             def mouse_clicked(self):
                 if terminal.tic_tac_toe.is_player_lobby_full():
                     pos = self._command.click().__getattribute__("click_point")
-                    self.post_event(ControlEvent.MARK_PLACED, cell=self._to_cell(pos), symbol=terminal.symbol)
+                    cell = self._to_cell(pos)
+                    if cell is not None:
+                        self.post_event(ControlEvent.MARK_PLACED, cell=cell, symbol=terminal.symbol)
 
             def post_event(self, event: Event | LobbyEvent | ControlEvent, **kwargs) -> Event:
                 pygame_event = super().post_event(event, **kwargs)
@@ -341,6 +395,12 @@ class TicTacToeTerminal(TicTacToeGame):
                     print(f"You lost because you left the game!")
                 terminal.stop()
 
+            def on_hint(self, tic_tac_toe: TicTacToe, cell: Cell, value: float, symbol: Symbol):
+                if cell is None:
+                    print("No hint available")
+                else:
+                    print(f"Hint for player '{symbol.value}': {cell} (evaluation: {value:+.2f})")
+
             def on_game_over(self, tic_tac_toe: TicTacToe, symbol: Symbol):
                 if symbol:
                     print(f"You won!" if symbol == terminal.symbol else f"You lost!")
@@ -4,7 +4,7 @@ from tic_tac_toe.model.grid import *
 from tic_tac_toe.model.game_object import *
 from tic_tac_toe.model import *
 from tic_tac_toe.controller import ControlEvent, LobbyEvent
-from tic_tac_toe.utils import Config
+from tic_tac_toe.utils import Config, Settings
 import json
 
 _DEBUG = False
@@ -35,6 +35,9 @@ class Serializer:
     def _serialize_primitive(self, obj):
         return obj
 
+    def _serialize_nonetype(self, obj: None) -> None:
+        return None
+
     def _serialize_any(self, obj: Any) -> Any:
         for klass in type(obj).mro():
             method_name = f"_serialize_{klass.__name__.lower()}"
@@ -77,13 +80,13 @@ class Serializer:
         return self._to_dict(mark, "size", "position", "name", "cell", "symbol")
     
     def _serialize_grid(self, grid: Grid) -> Dict:
-        return self._to_dict(grid, "dim", "cells")
+        return self._to_dict(grid, "dim", "win_length")
 
     def _serialize_vector2(self, vector: Vector2) -> Dict:
         return self._to_dict(vector, "x", "y")
 
     def _serialize_config(self, config: Config) -> Dict:
-        return self._to_dict(config, 'cell_width_size', 'cell_height_size')
+        return self._to_dict(config, 'cell_width_size', 'cell_height_size', 'dim')
 
     def _serialize_tictactoe(self, tic_tac_toe: TicTacToe) -> Dict:
         return self._to_dict(tic_tac_toe, 'players', 'marks', 'grid', 'turn', 'config', 'size', 'time', 'updates')
@@ -142,18 +145,21 @@ class Deserializer:
         return Mark(*self._from_dict(obj, "cell", "symbol", "size", "position", "name"))
     
     def _deserialize_grid(self, obj: Any) -> Grid:
-        return Grid(*self._from_dict(obj, "dim"))
+        # older peers send the list of cells instead of the win length, and only ever win with a full line
+        return Grid(self._deserialize(obj["dim"]), self._deserialize(obj.get("win_length")))
 
     def _deserialize_config(self, obj: Any) -> Config:
-        return Config(*self._from_dict(obj, 'cell_width_size', 'cell_height_size'))
+        # older peers send no dim, and always played on the default one
+        return Config(*self._from_dict(obj, 'cell_width_size', 'cell_height_size'), self._deserialize(obj.get('dim', Settings.dim)))
 
     def _deserialize_tictactoe(self, obj: Any) -> TicTacToe:
-        tic_tac_toe = TicTacToe(*self._from_dict(obj, 'size'))
+        # the grid comes first, since the marks are indexed against its lines
+        grid = self._deserialize(obj['grid'])
+        tic_tac_toe = TicTacToe(*self._from_dict(obj, 'size'), dim=grid.dim, win_length=grid.win_length)
+        tic_tac_toe.config = self._deserialize(obj['config'])
         tic_tac_toe.players = self._deserialize(obj['players'])
         tic_tac_toe.marks = self._deserialize(obj['marks'])
         tic_tac_toe.turn = self._deserialize(obj['turn'])
-        tic_tac_toe.grid = self._deserialize(obj['grid'])
-        tic_tac_toe.config = self._deserialize(obj['config'])
         tic_tac_toe.time = self._deserialize(obj['time'])
         tic_tac_toe.updates = self._deserialize(obj['updates'])
         return tic_tac_toe
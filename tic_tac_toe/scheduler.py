@@ -0,0 +1,76 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+# a fixed-step task that falls further behind than this drops the backlog instead of spiralling
+MAX_CATCH_UP_STEPS = 5
+# tolerance on deadlines, so that rounding in the accumulated step times never skips a step
+EPSILON = 1e-9
+
+@dataclass
+class Task:
+    name: str
+    callback: Callable[[float], None]
+    rate: Optional[float] = None
+    fixed: bool = False
+    last: float = 0.0
+    max_steps: int = MAX_CATCH_UP_STEPS
+
+    @property
+    def period(self) -> float:
+        return 1 / self.rate if self.rate else 0.0
+
+    @property
+    def due(self) -> float:
+        return self.last + self.period
+
+class Scheduler:
+    def __init__(self, clock: Callable[[], float]=time.perf_counter):
+        self.clock = clock
+        self.tasks: List[Task] = []
+
+    def add(self, name: str, callback: Callable[[float], None], rate: Optional[float]=None, fixed: bool=False,
+            max_steps: int=MAX_CATCH_UP_STEPS) -> Task:
+        # rate is in runs per second (None runs the task on every pass); fixed tasks always receive the same dt
+        task = Task(name, callback, rate, fixed and bool(rate), self.clock(), max_steps)
+        self.tasks.append(task)
+        return task
+
+    def task(self, name: str) -> Task:
+        return next(task for task in self.tasks if task.name == name)
+
+    def run_pending(self, now: float=None) -> int:
+        now = self.clock() if now is None else now
+        runs = 0
+        for task in self.tasks:
+            if task.fixed:
+                runs += self._run_fixed(task, now)
+            elif now + EPSILON >= task.due:
+                elapsed = now - task.last
+                # keep the cadence, unless the task is so late that it would fire twice in a row
+                task.last = task.due if task.period and now - task.due < task.period else now
+                task.callback(elapsed)
+                runs += 1
+        return runs
+
+    def idle_time(self, now: float=None, limit: Optional[float]=None) -> float:
+        now = self.clock() if now is None else now
+        # tasks without a rate piggyback on the others, so they never keep the loop awake
+        deadlines = [task.due for task in self.tasks if task.rate]
+        if limit is not None:
+            deadlines.append(now + limit)
+        return max(0.0, min(deadlines, default=now) - now)
+
+    def sleep(self):
+        time.sleep(self.idle_time())
+
+    def _run_fixed(self, task: Task, now: float) -> int:
+        period = task.period
+        steps = int((now - task.last + EPSILON) / period)
+        if steps > task.max_steps:
+            task.last += (steps - task.max_steps) * period
+            steps = task.max_steps
+        for _ in range(steps):
+            task.last += period
+            task.callback(period)
+        return steps
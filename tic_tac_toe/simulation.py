@@ -0,0 +1,115 @@
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+from pygame.event import Event
+from .ai import Strategy, create_strategy
+from .controller import ControlEvent, create_event
+from .controller.local import TicTacToeEventHandler
+from .log import logging
+from .model import TicTacToe, Player, Symbol
+from .utils import Settings
+
+class SimulatedGame(TicTacToeEventHandler):
+    def __init__(self, settings: Settings, strategies: Dict[Symbol, Strategy], max_moves: int=200, seed: int=None):
+        super().__init__(TicTacToe(
+            size=settings.size,
+            dim=settings.dim,
+            players=[Player(symbol) for symbol in Symbol.values()],
+            win_length=settings.win_length,
+            seed=seed
+        ))
+        self.strategies = strategies
+        self.max_moves = max_moves
+        self.moves = 0
+        self.over = False
+        self.winner: Optional[Symbol] = None
+        self._queue: Deque[Event] = deque()
+
+    @property
+    def tic_tac_toe(self) -> TicTacToe:
+        return self._tic_tac_toe
+
+    def post_event(self, event: Event | ControlEvent, **kwargs) -> Event:
+        event = create_event(event, **kwargs)
+        self._queue.append(event)
+        return event
+
+    def handle_events(self):
+        while self._queue:
+            self.handle_event(self._queue.popleft())
+
+    def on_game_over(self, tic_tac_toe: TicTacToe, symbol: Symbol):
+        self.over = True
+        self.winner = symbol
+
+    def run(self) -> Optional[Symbol]:
+        while not self.over and self.moves < self.max_moves:
+            turn = self.tic_tac_toe.turn
+            self.post_event(ControlEvent.MARK_PLACED, cell=self.strategies[turn].choose(self.tic_tac_toe), symbol=turn)
+            self.moves += 1
+            self.handle_events()
+        return self.winner
+
+@dataclass
+class SimulationReport:
+    games: int = 0
+    moves: int = 0
+    seconds: float = 0.0
+    outcomes: Counter = field(default_factory=Counter)
+
+    def __str__(self):
+        outcomes = ", ".join(f"{name}: {count} ({count / max(self.games, 1):.1%})" for name, count in sorted(self.outcomes.items()))
+        return (f"{self.games} games in {self.seconds:.2f}s ({self.games_per_second:.1f} games/s, "
+                f"{self.moves / max(self.games, 1):.1f} moves/game) - {outcomes}")
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds else 0.0
+
+    def merge(self, other: 'SimulationReport'):
+        self.games += other.games
+        self.moves += other.moves
+        self.outcomes.update(other.outcomes)
+
+def create_players(settings: Settings, strategies: Tuple[str, str], seed: int) -> Dict[Symbol, Strategy]:
+    # each player draws from its own stream: shared seeds would correlate their random choices
+    return {symbol: create_strategy(name, settings.bot_time_budget, seed * 2 + index, settings.tablebase)
+            for index, (symbol, name) in enumerate(zip((Symbol.CROSS, Symbol.NOUGHT), strategies))}
+
+def play_games(settings: Settings, strategies: Tuple[str, str], seeds: List[int], max_moves: int=200) -> SimulationReport:
+    if not settings.debug:
+        logging.disable(logging.DEBUG)
+    report = SimulationReport()
+    for seed in seeds:
+        players = create_players(settings, strategies, seed)
+        game = SimulatedGame(settings, players, max_moves, seed)
+        winner = game.run()
+        report.games += 1
+        report.moves += game.moves
+        report.outcomes[winner.name.lower() if winner else "unfinished"] += 1
+    return report
+
+def simulate(settings: Settings, games: int, strategies: Tuple[str, str]=('random', 'random'), workers: int=None,
+             max_moves: int=200, seed: int=0) -> SimulationReport:
+    start = time.perf_counter()
+    report = SimulationReport()
+    seeds = list(range(seed, seed + games))
+    if workers == 1:
+        report.merge(play_games(settings, strategies, seeds, max_moves))
+    else:
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = workers * 4
+            futures = [executor.submit(play_games, settings, strategies, seeds[i::chunks], max_moves) for i in range(chunks)]
+            for future in futures:
+                report.merge(future.result())
+    report.seconds = time.perf_counter() - start
+    return report
+
+def main_simulation(games: int, strategies: Tuple[str, str], workers: int=None, max_moves: int=200, seed: int=0,
+                    settings: Settings=None):
+    report = simulate(settings or Settings(), games, strategies, workers, max_moves, seed)
+    print(report)
@@ -11,22 +11,108 @@ class Settings:
     port: Optional[int] = None
     gui: bool = True
     dim: int = 3
+    win_length: Optional[int] = None
     lobby_size: int = 2
+    bot: Optional[str] = None
+    bot_strategy: str = 'alphabeta'
+    bot_time_budget: float = 0.05
+    # path of a tablebase, for the 'tablebase' bot strategy and for hints
+    tablebase: Optional[str] = None
+    hint_time_budget: float = 0.2
+    hint_cache_size: int = 4096
+    # simulation ticks per second (defaults to fps), state broadcasts per second (None: on every tick with changes)
+    tick_rate: Optional[int] = None
+    broadcast_rate: Optional[int] = 20
+    keyframe_interval: float = 1.0
+    seed: Optional[int] = None
+    record: Optional[str] = None
+    # block until an input or event arrives instead of looping at a fixed rate, waking at least every idle_timeout seconds
+    idle: bool = False
+    idle_timeout: float = 1.0
+
+# the fields every cached geometry depends on
+GEOMETRY = ('cell_width_size', 'cell_height_size', 'dim')
 
 @dataclass
 class Config:
     cell_width_size: int
     cell_height_size: int
+    dim: int = Settings.dim
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in GEOMETRY:
+            object.__setattr__(self, '_cells_area_matrix', None)
+            object.__setattr__(self, '_cells_symbol_position', None)
 
     @property
     def cells_area_matrix(self) -> Dict:
-        self._cells_area_matrix = dict()
-        for i in range(Settings.dim):
-            for j in range(Settings.dim):
-                self._cells_area_matrix[(i, j)] = ((int(i * self.cell_width_size), int((i + 1) * self.cell_width_size)),
-                                        (int(j * self.cell_height_size), int((j + 1) * self.cell_height_size)))
+        if self._cells_area_matrix is None:
+            self._cells_area_matrix = {(i, j): self.cell_area(i, j) for i in range(self.dim) for j in range(self.dim)}
         return self._cells_area_matrix
     
     @property
     def cells_symbol_position(self) -> Dict:
-        return {cell: (int(mean(area[0])), int(mean(area[1]))) for cell, area in self.cells_area_matrix.items()}
+        if self._cells_symbol_position is None:
+            self._cells_symbol_position = {cell: self.cell_symbol_position(*cell) for cell in self.cells_area_matrix}
+        return self._cells_symbol_position
+
+    def cell_area(self, i: int, j: int) -> Tuple:
+        return ((int(i * self.cell_width_size), int((i + 1) * self.cell_width_size)),
+                (int(j * self.cell_height_size), int((j + 1) * self.cell_height_size)))
+
+    def cell_symbol_position(self, i: int, j: int) -> Tuple:
+        area = self.cell_area(i, j)
+        return (int(mean(area[0])), int(mean(area[1])))
+
+    def cell_at(self, x: float, y: float) -> Optional[Tuple[int, int]]:
+        i, j = self._index_at(x, self.cell_width_size), self._index_at(y, self.cell_height_size)
+        return (i, j) if i is not None and j is not None else None
+
+    def _index_at(self, coordinate: float, cell_size: float) -> Optional[int]:
+        # the guess can be one cell off, because the borders of each cell are truncated to integers
+        index = int(coordinate // cell_size)
+        if coordinate >= int((index + 1) * cell_size):
+            index += 1
+        elif coordinate < int(index * cell_size):
+            index -= 1
+        return index if 0 <= index < self.dim else None
+
+@dataclass
+class Viewport:
+    # the window shows the world (the whole grid at zoom 1) from (x, y), magnified by zoom
+    width: float
+    height: float
+    x: float = 0.0
+    y: float = 0.0
+    zoom: float = 1.0
+    max_zoom: float = 64.0
+
+    def to_world(self, x: float, y: float) -> Tuple[float, float]:
+        return self.x + x / self.zoom, self.y + y / self.zoom
+
+    def to_screen(self, x: float, y: float) -> Tuple[float, float]:
+        return (x - self.x) * self.zoom, (y - self.y) * self.zoom
+
+    def visible_area(self) -> Tuple[float, float, float, float]:
+        return self.x, self.y, self.x + self.width / self.zoom, self.y + self.height / self.zoom
+
+    def scroll(self, dx: float, dy: float):
+        # by screen pixels
+        self.x += dx / self.zoom
+        self.y += dy / self.zoom
+        self._clamp()
+
+    def zoom_at(self, factor: float, x: float, y: float):
+        # the point under (x, y) on the screen stays where it is
+        world_x, world_y = self.to_world(x, y)
+        self.zoom = min(max(self.zoom * factor, 1.0), self.max_zoom)
+        self.x, self.y = world_x - x / self.zoom, world_y - y / self.zoom
+        self._clamp()
+
+    def reset(self):
+        self.x, self.y, self.zoom = 0.0, 0.0, 1.0
+
+    def _clamp(self):
+        self.x = min(max(self.x, 0.0), self.width - self.width / self.zoom)
+        self.y = min(max(self.y, 0.0), self.height - self.height / self.zoom)
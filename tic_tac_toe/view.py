@@ -1,65 +1,209 @@
+import math
 import pygame
-from pygame import draw, Surface
-from tic_tac_toe.model import TicTacToe, Symbol, Mark
+from pygame import draw, Rect, Surface
+from typing import Dict, List, Optional, Set, Tuple
+from tic_tac_toe.model import TicTacToe, Symbol, Mark, Cell
+from tic_tac_toe.utils import Viewport
 
 SCREEN_BACKGROUND_COLOR = "black"
 GAME_OBJECT_COLOR = "white"
 GRID_LINE_WIDTH = 1
 LINE_WIDTH = 2
-CIRCLE_RADIUS = 60
+# sizes of the marks relative to the shorter side of a cell (60 and 50 pixels on the default 900x600 window)
+CIRCLE_RADIUS = 0.3
+CROSS_HALF_SIZE = 0.25
+# the window was uncovered, resized or restored: whatever was on screen is gone
+REPAINT_EVENTS = (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN,
+                  pygame.WINDOWRESTORED, pygame.WINDOWRESIZED, pygame.WINDOWSIZECHANGED)
 
 class TicTacToeView:
+    # the events a view consumes itself, which must also wake an idle game loop
+    EVENTS = ()
+
     def __init__(self, tic_tac_toe: TicTacToe):
         self._tic_tac_toe = tic_tac_toe
+        # what part of the grid this client shows: local to the view, never part of the game state
+        self.viewport = Viewport(tic_tac_toe.size.x, tic_tac_toe.size.y)
 
     def render(self):
         raise NotImplemented
 
+    def present(self):
+        pass
+
 class ShowNothingTicTacToeView(TicTacToeView):
     def render(self):
         pass
 
 class ScreenTicTacToeView(TicTacToeView):
+    EVENTS = REPAINT_EVENTS
+
     def __init__(self, tic_tac_toe: TicTacToe, screen: Surface=None):
         super().__init__(tic_tac_toe)
         self._screen = screen or pygame.display.set_mode(tic_tac_toe.size)
+        self._dirty: Set[Cell] = set()
+        self._repaint = True
+        self._geometry = None
+        # one pre-rendered sprite per symbol, for the current cell size
+        self._sprites: Dict[Symbol, Surface] = {}
+        self._reach = 0
+        self.rects: List[Rect] = []
+        tic_tac_toe.add_listener(self._on_cell_changed)
 
     def __getattr__(self, name: str):
         if not name.startswith("draw_"):
             raise AttributeError(f"{type(self).__name__} has no attribute '{name}'")
-        name = name[5:]
-        function = getattr(draw, name)
-        return lambda *args, **kwargs: function(self._screen, *args, **kwargs)
+        function = getattr(draw, name[5:])
+        # cached on the instance, so that __getattr__ only runs on the first lookup
+        method = lambda *args, **kwargs: function(self._screen, *args, **kwargs)
+        setattr(self, name, method)
+        return method
 
     def render(self):
+        if pygame.display.get_surface() is not None and pygame.event.get(self.EVENTS):
+            self._repaint = True
+        config, viewport = self._tic_tac_toe.config, self.viewport
+        # the sprites only depend on the size of the cells on screen, while scrolling just repaints
+        scale = (config.cell_width_size, config.cell_height_size, viewport.zoom)
+        geometry = (self._screen.get_size(), config.dim, viewport.x, viewport.y, scale)
+        if self._repaint or geometry != self._geometry:
+            if geometry != self._geometry:
+                if self._geometry is None or scale != self._geometry[-1]:
+                    self._sprites.clear()
+                    self._reach = self._mark_reach()
+                self._geometry = geometry
+                viewport.width, viewport.height = self._screen.get_size()
+            self.render_all()
+        elif self._dirty:
+            self.render_cells(self._dirty)
+        self._repaint = False
+        self._dirty.clear()
+
+    def present(self):
+        if self.rects:
+            pygame.display.update(self.rects)
+            self.rects = []
+
+    def render_all(self):
         self._screen.fill(SCREEN_BACKGROUND_COLOR)
         self.render_grid()
-        for mark in self._tic_tac_toe.marks:
+        for mark in self._visible_marks():
             self.render_mark(mark)
+        self.rects = [self._screen.get_rect()]
+
+    def render_cells(self, cells: Set[Cell]):
+        # each changed cell is repainted together with whatever the marks of its neighbours draw over it;
+        # marks are redrawn whole, since clipping would rasterise their diagonals differently
+        area = self._screen.get_rect()
+        columns, rows = self._visible_cells()
+        for cell in cells:
+            if cell.x not in columns or cell.y not in rows:
+                continue
+            rect = self._mark_rect(cell).union(self._cell_rect(cell)).clip(area)
+            self._screen.set_clip(rect)
+            self._screen.fill(SCREEN_BACKGROUND_COLOR, rect)
+            self.render_grid()
+            self._screen.set_clip(None)
+            for mark in self._marks_around(cell):
+                self.render_mark(mark)
+            self.rects.append(rect)
+
+    def _on_cell_changed(self, cell: Optional[Cell]):
+        if cell is None:
+            self._repaint = True
+        else:
+            self._dirty.add(cell)
+
+    def _visible_cells(self) -> Tuple[range, range]:
+        # the cells on screen, plus those whose marks reach into it
+        config, viewport = self._tic_tac_toe.config, self.viewport
+        left, top, right, bottom = viewport.visible_area()
+        margin = self._reach / viewport.zoom
+        return (range(max(0, int((left - margin) // config.cell_width_size)),
+                      min(config.dim, int((right + margin) // config.cell_width_size) + 1)),
+                range(max(0, int((top - margin) // config.cell_height_size)),
+                      min(config.dim, int((bottom + margin) // config.cell_height_size) + 1)))
+
+    def _visible_marks(self) -> List[Mark]:
+        # either look the visible cells up, or filter the marks: whichever is fewer
+        tic_tac_toe = self._tic_tac_toe
+        columns, rows = self._visible_cells()
+        if len(columns) * len(rows) > tic_tac_toe.count_marks(Symbol.CROSS) + tic_tac_toe.count_marks(Symbol.NOUGHT):
+            return [mark for mark in tic_tac_toe.marks if mark.cell.x in columns and mark.cell.y in rows]
+        return [tic_tac_toe.get_mark(Cell(x, y)) for x in columns for y in rows if tic_tac_toe.has_mark(Cell(x, y))]
+
+    def _cell_rect(self, cell: Cell) -> Rect:
+        (left, right), (top, bottom) = self._tic_tac_toe.config.cell_area(cell.x, cell.y)
+        left, top = self.viewport.to_screen(left, top)
+        right, bottom = self.viewport.to_screen(right, bottom)
+        return Rect(math.floor(left), math.floor(top), math.ceil(right) - math.floor(left), math.ceil(bottom) - math.floor(top))
+
+    def _mark_rect(self, cell: Cell) -> Rect:
+        x, y = self.viewport.to_screen(*self._tic_tac_toe.config.cell_symbol_position(cell.x, cell.y))
+        return Rect(int(x) - self._reach, int(y) - self._reach, 2 * self._reach + 1, 2 * self._reach + 1)
+
+    def _marks_around(self, cell: Cell) -> List[Mark]:
+        config, zoom = self._tic_tac_toe.config, self.viewport.zoom
+        reach_x = math.ceil(2 * self._reach / (config.cell_width_size * zoom))
+        reach_y = math.ceil(2 * self._reach / (config.cell_height_size * zoom))
+        marks = []
+        for x in range(max(0, cell.x - reach_x), min(config.dim, cell.x + reach_x + 1)):
+            for y in range(max(0, cell.y - reach_y), min(config.dim, cell.y + reach_y + 1)):
+                if self._tic_tac_toe.has_mark(Cell(x, y)):
+                    marks.append(self._tic_tac_toe.get_mark(Cell(x, y)))
+        return marks
 
     def render_grid(self):
-        for d in range(1, self._tic_tac_toe.grid.dim):
-            x = d * self._tic_tac_toe.config.cell_width_size
-            y = d * self._tic_tac_toe.config.cell_height_size
-            self.draw_line(GAME_OBJECT_COLOR, (x, 0), (x, self._screen.get_height()), width=GRID_LINE_WIDTH)
-            self.draw_line(GAME_OBJECT_COLOR, (0, y), (self._screen.get_width(), y), width=GRID_LINE_WIDTH)
+        config, viewport = self._tic_tac_toe.config, self.viewport
+        columns, rows = self._visible_cells()
+        left, top = viewport.to_screen(0, 0)
+        right, bottom = viewport.to_screen(config.dim * config.cell_width_size, config.dim * config.cell_height_size)
+        left, top = max(left, 0), max(top, 0)
+        right, bottom = min(right, self._screen.get_width()), min(bottom, self._screen.get_height())
+        for d in range(max(1, columns.start), min(config.dim, columns.stop + 1)):
+            x, _ = viewport.to_screen(d * config.cell_width_size, 0)
+            self.draw_line(GAME_OBJECT_COLOR, (x, top), (x, bottom), width=GRID_LINE_WIDTH)
+        for d in range(max(1, rows.start), min(config.dim, rows.stop + 1)):
+            _, y = viewport.to_screen(0, d * config.cell_height_size)
+            self.draw_line(GAME_OBJECT_COLOR, (left, y), (right, y), width=GRID_LINE_WIDTH)
 
     def render_mark(self, mark: Mark):
         assert mark.symbol in Symbol.values(), f"Error! Passed a mark with a not valid ({mark.symbol})."
-        self._render_nought(mark) if mark.is_nought else self._render_cross(mark)
+        (x, y) = self.viewport.to_screen(*mark.position)
+        self._screen.blit(self._sprite(mark.symbol), (int(x) - self._reach, int(y) - self._reach))
+
+    def _mark_reach(self) -> int:
+        # how far a mark is drawn from the centre of its cell
+        side = self._cell_side()
+        return round(max(CIRCLE_RADIUS, CROSS_HALF_SIZE) * side) + LINE_WIDTH
+
+    def _cell_side(self) -> float:
+        config = self._tic_tac_toe.config
+        return min(config.cell_width_size, config.cell_height_size) * self.viewport.zoom
+
+    def _sprite(self, symbol: Symbol) -> Surface:
+        sprite = self._sprites.get(symbol)
+        if sprite is None:
+            sprite = Surface((2 * self._reach + 1, 2 * self._reach + 1), pygame.SRCALPHA)
+            self._render_nought(sprite) if symbol.is_nought else self._render_cross(sprite)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self._sprites[symbol] = sprite
+        return sprite
 
-    def _render_nought(self, mark: Mark):
-        self.draw_circle(GAME_OBJECT_COLOR, (mark.position), radius=CIRCLE_RADIUS, width=LINE_WIDTH)
+    def _render_nought(self, sprite: Surface):
+        side = self._cell_side()
+        draw.circle(sprite, GAME_OBJECT_COLOR, (self._reach, self._reach), radius=round(CIRCLE_RADIUS * side), width=LINE_WIDTH)
 
-    def _render_cross(self, mark: Mark):
-        (x, y) = mark.position
-        self._draw_line(x, y, inverted=False)
-        self._draw_line(x, y, inverted=True)
+    def _render_cross(self, sprite: Surface):
+        self._draw_line(sprite, self._reach, self._reach, inverted=False)
+        self._draw_line(sprite, self._reach, self._reach, inverted=True)
 
-    def _draw_line(self, x: float, y: float, inverted: bool):
-        point_plus_minus = 50
+    def _draw_line(self, sprite: Surface, x: float, y: float, inverted: bool):
+        side = self._cell_side()
+        point_plus_minus = round(CROSS_HALF_SIZE * side)
         if not inverted:
             line_points = [(x-point_plus_minus, y-point_plus_minus), (x+point_plus_minus, y+point_plus_minus)]
         else:
             line_points = [(x-point_plus_minus, y+point_plus_minus), (x+point_plus_minus, y-point_plus_minus)] 
-        self.draw_lines(GAME_OBJECT_COLOR, closed=True, points=line_points, width=LINE_WIDTH)
+        draw.lines(sprite, GAME_OBJECT_COLOR, closed=True, points=line_points, width=LINE_WIDTH)